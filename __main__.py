@@ -1,21 +1,12 @@
+import logging
+import orjson
 import uvicorn
 import os
 import time
 
-# Force Pacific Standard Time timezone (CRITICAL for tic-tac-toe validation)
-os.environ['TZ'] = 'US/Pacific'
-if hasattr(time, 'tzset'):
-    time.tzset()
-    print("✓ System timezone set to US/Pacific")
-
-# Verify timezone is correctly set
-import datetime
-current_time = datetime.datetime.now()
-print(f"✓ Current system time: {current_time} (should be Pacific time)")
-
-# Additional environment variables for timezone consistency
-os.environ['LC_TIME'] = 'en_US.UTF-8'
-os.environ['LANG'] = 'en_US.UTF-8'
+# Agent debug output is logged at DEBUG level; set LOG_LEVEL=debug to see it
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'warning').lower()
+logging.basicConfig(level=getattr(logging, LOG_LEVEL.upper(), logging.WARNING))
 
 try:
     from a2a.server.apps import A2AStarletteApplication
@@ -26,7 +17,7 @@ try:
         AgentCard,
         AgentSkill,
     )
-    from starlette.middleware.cors import CORSMiddleware
+    from asgi_utils import FastCORSMiddleware
     print("✓ a2a modules and CORS middleware imported")
 except ImportError as e:
     print(f"✗ Failed to import a2a modules: {e}")
@@ -41,141 +32,185 @@ except ImportError as e:
     print(f"✗ Failed to import agent_executor: {e}")
     exit(1)
 
-if __name__ == '__main__':
+# Prefer uvloop (libuv-based event loop) for uvicorn; fall back to asyncio where unavailable (e.g. Windows)
+try:
+    import uvloop  # noqa: F401
+    UVICORN_LOOP = 'uvloop'
+    print("✓ uvloop available, using it as the event loop")
+except ImportError:
+    UVICORN_LOOP = 'asyncio'
+
+def build_app():
+    """Build the A2A Starlette application with CORS and the homepage route"""
     print("Creating agent configuration...")
     
-    try:
-        # --8<-- [start:AgentSkill]
-        arithmetic_skill = AgentSkill(
-            id='basic_arithmetic_operations',
-            name='Arithmetic Skill',
-            description='Returns answers to basic arithmetic operations',
-            tags=['arithmetic', 'basic'],
-            examples=['6', '-3', '0', '452', '12344'],
-        )
-        
-        crypto_skill = AgentSkill(
-            id='cryptographic_operations',
-            name='Cryptographic Tools',
-            description='Generate MD5 and SHA512 hashes of text',
-            tags=['hash', 'crypto', 'md5', 'sha512'],
-            examples=['d41d8cd98f00b204e9800998ecf8427e', 'cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e'],
-        )
-        
-        encoding_skill = AgentSkill(
-            id='encoding_operations',
-            name='Encoding Tools',
-            description='Encode and decode base64 data',
-            tags=['encoding', 'base64', 'decode'],
-            examples=['SGVsbG8gV29ybGQ=', 'Hello World'],
-        )
-        
-        code_execution_skill = AgentSkill(
-            id='code_execution',
-            name='Code Execution',
-            description='Write and execute Python code to solve complex computational problems, algorithms, and mathematical calculations',
-            tags=['python', 'code', 'algorithms', 'computation', 'prime', 'math'],
-            examples=['Finding prime numbers up to 100', 'Computing factorial of 50', 'Sum of squares modulo 1000', 'Fibonacci sequence'],
-        )
-        
-        conversation_history_skill = AgentSkill(
-            id='conversation_history',
-            name='Conversation History',
-            description='Access and review previous client inputs stored in a local SQLite database for context and reference',
-            tags=['history', 'database', 'memory', 'context', 'previous', 'sqlite'],
-            examples=['Show me the last 5 things I asked', 'What did we discuss earlier?', 'Review previous requests', 'Check conversation history'],
-        )
-
-        image_understanding_skill = AgentSkill(
-            id='image_understanding',
-            name='Image Understanding',
-            description='Analyze and describe images, identify objects, text, scenes, and answer questions about image content',
-            tags=['image', 'vision', 'recognition', 'analysis', 'OCR'],
-            examples=['What is in this image?', 'Describe this picture', 'Read the text in this image', 'Identify objects in the photo'],
-        )
-        
-        tictactoe_skill = AgentSkill(
-            id='tictactoe_game',
-            name='Tic-Tac-Toe Gaming',
-            description='Play tic-tac-toe games on https://ttt.puppy9.com/, win games strategically, and extract 14-digit winning numbers',
-            tags=['gaming', 'tictactoe', 'strategy', 'winning', 'automation'],
-            examples=['20250902101461', 'Play tic-tac-toe and get winning number', 'Win the game at ttt.puppy9.com'],
-        )
-        print("✓ Agent skills created")
-
-        # --8<-- [start:AgentCard]
-        # This will be the public-facing agent card
-        public_agent_card = AgentCard(
-            name='Agent Beats Practice Agent',
-            description='A versatile AI assistant that can perform arithmetic calculations, generate cryptographic hashes (MD5, SHA512), handle base64 encoding/decoding operations, execute Python code to solve complex computational problems, access conversation history from a local database, analyze images and provide descriptions, and play tic-tac-toe games to win 14-digit numbers',
-            url='http://localhost:3000/',
-            version='1.0.0',
-            default_input_modes=['text', 'image'],
-            default_output_modes=['text'],
-            capabilities=AgentCapabilities(streaming=True),
-            skills=[arithmetic_skill, crypto_skill, encoding_skill, code_execution_skill, conversation_history_skill, image_understanding_skill, tictactoe_skill],
-            supports_authenticated_extended_card=True,
-        )
-        print("✓ Agent card created")
-        # --8<-- [end:AgentCard]
-
-        # This will be the authenticated extended agent card
-        # It includes the additional 'extended_skill'
-
-        request_handler = DefaultRequestHandler(
-            agent_executor=AgentBeatsPracticeAgentExecutor(),
-            task_store=InMemoryTaskStore(),
-        )
-        print("✓ Request handler created")
-
-        server = A2AStarletteApplication(
-            agent_card=public_agent_card,
-            http_handler=request_handler,
-        )
-        print("✓ A2A server application created")
-        
-        # Add CORS middleware to handle cross-origin requests
-        # Build the server application
-        app = server.build()
-        
-        # Add CORS (Cross-Origin Resource Sharing) middleware
-        # This allows web browsers from different domains/origins to access our API
-        # The "*" means we're allowing all domains to access it (good for development, but should be restricted in production)
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],  # Allow all origins for development
-            allow_credentials=True,
-            allow_methods=["*"],  # Allow all methods including OPTIONS
-            allow_headers=["*"],  # Allow all headers
-        )
-        print("✓ CORS middleware added")
-        
-        # Import what we need to create a basic homepage endpoint
-        from starlette.responses import JSONResponse
-        from starlette.routing import Route
-        
-        # Create a handler function for the homepage that returns basic server info
-        async def root_handler(request):
-            return JSONResponse({
-                "message": "Agent Beats Practice Agent is running!",
-                "status": "online",
-                "endpoints": {
-                    "agent_card": "/.well-known/agent-card.json",  # Endpoint that describes the agent's capabilities
-                    "a2a_rpc": "/a2a",  # Main endpoint for agent-to-agent communication
-                }
-            })
-        
-        # Add the homepage route as the first route
-        app.routes.insert(0, Route("/", root_handler, methods=["GET"]))
-        print("✓ Root handler added")
-        
-        # Start the server using uvicorn
-        # 0.0.0.0 means accept connections from any IP address
-        # Port 3000 is where the server will listen for requests
-        print("Starting server on http://0.0.0.0:3000...")
-        uvicorn.run(app, host='0.0.0.0', port=3000)
-        
-    except Exception as e:
-        print(f"✗ Error creating server: {e}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
+    # --8<-- [start:AgentSkill]
+    arithmetic_skill = AgentSkill(
+        id='basic_arithmetic_operations',
+        name='Arithmetic Skill',
+        description='Returns answers to basic arithmetic operations',
+        tags=['arithmetic', 'basic'],
+        examples=['6', '-3', '0', '452', '12344'],
+    )
+
+    crypto_skill = AgentSkill(
+        id='cryptographic_operations',
+        name='Cryptographic Tools',
+        description='Generate MD5 and SHA512 hashes of text',
+        tags=['hash', 'crypto', 'md5', 'sha512'],
+        examples=['d41d8cd98f00b204e9800998ecf8427e', 'cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e'],
+    )
+
+    encoding_skill = AgentSkill(
+        id='encoding_operations',
+        name='Encoding Tools',
+        description='Encode and decode base64 data',
+        tags=['encoding', 'base64', 'decode'],
+        examples=['SGVsbG8gV29ybGQ=', 'Hello World'],
+    )
+
+    code_execution_skill = AgentSkill(
+        id='code_execution',
+        name='Code Execution',
+        description='Write and execute Python code to solve complex computational problems, algorithms, and mathematical calculations',
+        tags=['python', 'code', 'algorithms', 'computation', 'prime', 'math'],
+        examples=['Finding prime numbers up to 100', 'Computing factorial of 50', 'Sum of squares modulo 1000', 'Fibonacci sequence'],
+    )
+
+    conversation_history_skill = AgentSkill(
+        id='conversation_history',
+        name='Conversation History',
+        description='Access and review previous client inputs stored in a local SQLite database for context and reference',
+        tags=['history', 'database', 'memory', 'context', 'previous', 'sqlite'],
+        examples=['Show me the last 5 things I asked', 'What did we discuss earlier?', 'Review previous requests', 'Check conversation history'],
+    )
+
+    image_understanding_skill = AgentSkill(
+        id='image_understanding',
+        name='Image Understanding',
+        description='Analyze and describe images, identify objects, text, scenes, and answer questions about image content',
+        tags=['image', 'vision', 'recognition', 'analysis', 'OCR'],
+        examples=['What is in this image?', 'Describe this picture', 'Read the text in this image', 'Identify objects in the photo'],
+    )
+
+    tictactoe_skill = AgentSkill(
+        id='tictactoe_game',
+        name='Tic-Tac-Toe Gaming',
+        description='Play tic-tac-toe games on https://ttt.puppy9.com/, win games strategically, and extract 14-digit winning numbers',
+        tags=['gaming', 'tictactoe', 'strategy', 'winning', 'automation'],
+        examples=['20250902101461', 'Play tic-tac-toe and get winning number', 'Win the game at ttt.puppy9.com'],
+    )
+    print("✓ Agent skills created")
+
+    # --8<-- [start:AgentCard]
+    # This will be the public-facing agent card
+    public_agent_card = AgentCard(
+        name='Agent Beats Practice Agent',
+        description='A versatile AI assistant that can perform arithmetic calculations, generate cryptographic hashes (MD5, SHA512), handle base64 encoding/decoding operations, execute Python code to solve complex computational problems, access conversation history from a local database, analyze images and provide descriptions, and play tic-tac-toe games to win 14-digit numbers',
+        url='http://localhost:3000/',
+        version='1.0.0',
+        default_input_modes=['text', 'image'],
+        default_output_modes=['text'],
+        capabilities=AgentCapabilities(streaming=True),
+        skills=[arithmetic_skill, crypto_skill, encoding_skill, code_execution_skill, conversation_history_skill, image_understanding_skill, tictactoe_skill],
+        supports_authenticated_extended_card=True,
+    )
+    print("✓ Agent card created")
+    # --8<-- [end:AgentCard]
+
+    # This will be the authenticated extended agent card
+    # It includes the additional 'extended_skill'
+
+    request_handler = DefaultRequestHandler(
+        agent_executor=AgentBeatsPracticeAgentExecutor(),
+        task_store=InMemoryTaskStore(),
+    )
+    print("✓ Request handler created")
+
+    server = A2AStarletteApplication(
+        agent_card=public_agent_card,
+        http_handler=request_handler,
+    )
+    print("✓ A2A server application created")
+
+    # Add CORS middleware to handle cross-origin requests
+    # Build the server application
+    app = server.build()
+
+    # Add CORS (Cross-Origin Resource Sharing) middleware
+    # This allows web browsers from different domains/origins to access our API
+    # All origins, methods and headers are allowed (good for development, but should be restricted in production)
+    # FastCORSMiddleware is pure ASGI, so no Request/Response objects are built per call
+    app.add_middleware(FastCORSMiddleware)
+    print("✓ CORS middleware added")
+
+    # Import what we need to create a basic homepage endpoint
+    from starlette.routing import Route
+    from asgi_utils import StaticJSONApp
+
+    # The homepage returns basic server info; it never changes, so serialize it once up front
+    root_handler = StaticJSONApp({
+        "message": "Agent Beats Practice Agent is running!",
+        "status": "online",
+        "endpoints": {
+            "agent_card": "/.well-known/agent-card.json",  # Endpoint that describes the agent's capabilities
+            "a2a_rpc": "/a2a",  # Main endpoint for agent-to-agent communication
+        }
+    })
+
+    # Add the homepage route as the first route
+    app.routes.insert(0, Route("/", root_handler, methods=["GET"]))
+    print("✓ Root handler added")
+
+    # The agent card is immutable after startup, so serialize it once and serve the bytes directly
+    # instead of letting the A2A app re-dump the Pydantic model on every discovery request
+    agent_card_handler = StaticJSONApp(
+        orjson.dumps(public_agent_card.model_dump(mode='json', by_alias=True, exclude_none=True))
+    )
+    app.routes.insert(0, Route("/.well-known/agent-card.json", agent_card_handler, methods=["GET"]))
+    print("✓ Static agent card route added")
+    
+    return app
+
+
+# The app is built at import time so uvicorn workers can load it via the "__main__:app" import string
+try:
+    app = build_app()
+except Exception as e:
+    print(f"✗ Error creating server: {e}")
+    import traceback
+    traceback.print_exc()
+    exit(1)
+
+if __name__ == '__main__':
+    # Force Pacific Standard Time timezone (CRITICAL for tic-tac-toe validation)
+    # This is the only place it is set: done here rather than at import so worker reloads/imports
+    # don't repeat it, and uvicorn workers inherit the environment
+    os.environ.update({'TZ': 'US/Pacific', 'LC_TIME': 'en_US.UTF-8', 'LANG': 'en_US.UTF-8'})
+    if hasattr(time, 'tzset'):
+        time.tzset()
+        print("✓ System timezone set to US/Pacific")
+    
+    # Verify timezone is correctly set
+    if os.getenv('DEBUG_TZ'):
+        import datetime
+        print(f"✓ Current system time: {datetime.datetime.now()} (should be Pacific time)")
+    
+    # Number of worker processes; each worker has its own task store, response cache and browser,
+    # so keep the default at 1 unless clients don't rely on follow-up task lookups
+    workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+    
+    # Start the server using uvicorn
+    # 0.0.0.0 means accept connections from any IP address
+    # Port 3000 is where the server will listen for requests
+    # Access logging is disabled to cut per-request overhead
+    print(f"Starting server on http://0.0.0.0:3000 with {workers} worker(s)...")
+    uvicorn.run(
+        '__main__:app' if workers > 1 else app,  # Multiple workers need an import string
+        host='0.0.0.0',
+        port=3000,
+        workers=workers,
+        loop=UVICORN_LOOP,
+        access_log=False,
+        log_level=LOG_LEVEL if LOG_LEVEL in uvicorn.config.LOG_LEVELS else 'warning',  # Unknown levels fall back like basicConfig
+    )
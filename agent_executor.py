@@ -1,84 +1,47 @@
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.utils import new_agent_text_message, new_task
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from collections import OrderedDict
 import anthropic
+import asyncio
+import hashlib
+import httpx
+import importlib.util
+import logging
 import os
-import time
+import weakref
 from dotenv import load_dotenv
-import re
 import json
-from tools import AVAILABLE_TOOLS, execute_tool, store_client_input
+from arithmetic import solve_simple_arithmetic
+from image_utils import prepare_image
+from tools import AVAILABLE_TOOLS, FINAL_ANSWER_TOOL, SEQUENTIAL_TOOLS, STATEFUL_TOOLS, execute_tool, execute_tools_in_order, store_client_inputs
 
-# Ensure Pacific Time Zone is set (CRITICAL for tic-tac-toe validation)
-os.environ['TZ'] = 'US/Pacific' 
-os.environ['LC_TIME'] = 'en_US.UTF-8'
-os.environ['LANG'] = 'en_US.UTF-8'
-if hasattr(time, 'tzset'):
-    time.tzset()
+# Load environment variables from the .env file next to this module (variables already set in the environment win)
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'), override=False)
 
-# Load environment variables from .env file
-load_dotenv()
+# Debug output goes through logging so it costs nothing unless DEBUG is enabled
+logger = logging.getLogger("agent_beats")
 
+# Messages returned by AnthropicModel.chat when it could not produce a real answer (never cached)
+CLAUDE_ERROR_PREFIX = "Claude API error"
+EMPTY_RESPONSE_MESSAGE = "I apologize, but I couldn't generate a proper response."
+MAX_ITERATIONS_MESSAGE = "I've completed the available tool calls but reached the maximum iteration limit."
 
-class AgentBeatsPracticeAgent:
-    """Agent Beats Practice Agent with Image Support"""
-    
-    def __init__(self):
-        self.claude = AnthropicModel()
+# Sent by the executor when the agent's result is empty. Messages get a fresh message_id each time,
+# so only the text is shared
+IMAGE_FALLBACK_MESSAGE = "I apologize, I was unable to process your image."
+TEXT_FALLBACK_MESSAGE = "I apologize, I was unable to process that request."
 
-    async def invoke(self, user_input: str, images: List[Dict[str, Any]] = None) -> str:
-        """Process user input and images, return only the string response."""
-        try:
-            print(f"User input: {user_input}")
-            if images:
-                print(f"Images provided: {len(images)} image(s)")
-                for i, img in enumerate(images):
-                    print(f"  Image {i+1}: {img['media_type']}, data length: {len(img['data'])} chars")
-            
-            # Create message with both text and images
-            messages = [{'role': 'user', 'content': user_input}]
-            
-            # Pass images to Claude
-            resp = await self.claude.chat(messages=messages, images=images)
-            print(f"Claude response: {resp}")
-            return resp
-        except Exception as e:
-            error_msg = f"Error processing request: {str(e)}"
-            print(error_msg)
-            return error_msg
-    
-    def extract_numerical_answer(self, response: str) -> str:
-        """Extract just the numerical answer from Claude's response"""
-        # Remove any leading/trailing whitespace
-        response = response.strip()
-        
-        # Try to find a number at the start of the response
-        number_match = re.match(r'^(\d+(?:\.\d+)?)', response)
-        if number_match:
-            return number_match.group(1)
-        
-        # Try to find the last number in the response
-        numbers = re.findall(r'\b\d+(?:\.\d+)?\b', response)
-        if numbers:
-            return numbers[-1]
-        
-        # If no clear number found, return the original response
-        return response
+# Marks a tool result whose body was replaced by a stub in long conversations
+ELIDED_RESULT_PREFIX = "[tool_result elided: "
 
-class AnthropicModel:
-    """Claude (Anthropic) Model with Tool Support and Vision"""
-    def __init__(self):
-        # Get API key from environment variables
-        api_key = os.getenv('ANTHROPIC_API_KEY')
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-        
-        self.client = anthropic.Anthropic(api_key=api_key)
-        self.model = 'claude-3-5-sonnet-20241022'  # Latest Claude model with vision
-        self.max_context_messages = 20  # Reduced for efficiency - focus on recent context only
-        self.max_tokens_estimate = 150000  # Conservative estimate for context limit
-        self.system_prompt = """You are a helpful AI assistant with tools for math, hashing (MD5/SHA512), base64 encoding/decoding, Python code execution, conversation history access, image analysis, and tic-tac-toe gaming.
+# Earlier user/assistant messages kept per conversation and replayed to Claude on follow-up requests
+MAX_CHANNEL_HISTORY_MESSAGES = 50
+
+# Shared by every AnthropicModel instance. Images sent alongside it are pre-shrunk to
+# 1568px long edge / ~1.15MP by image_utils.prepare_image (Claude's own resize threshold)
+SYSTEM_PROMPT = """You are a helpful AI assistant with tools for math, hashing (MD5/SHA512), base64 encoding/decoding, Python code execution, conversation history access, image analysis, and tic-tac-toe gaming.
 
 TOOLS USAGE:
 - Math: Solve step by step, provide numerical answers
@@ -116,10 +79,9 @@ DECISION MAKING:
 - Think one move ahead: "If I play here, what can the computer do?"
 
 CRITICAL: TIC-TAC-TOE WINNING NUMBER RETURN:
-- After successfully extracting a winning number (14-digit code), you MUST return it as your final response
-- Format: "🏆 Victory! Winning number: [14-digit-code]"
-- Example: "🏆 Victory! Winning number: 20250902104856"
-- ALWAYS use close_tictactoe_browser after getting the winning number, then provide the final response
+- After successfully extracting a winning number (14-digit code), you MUST return it with the final_answer tool
+- Call final_answer with value set to the 14 digits only, e.g. final_answer(value="20250902104856")
+- ALWAYS use close_tictactoe_browser after getting the winning number, then call final_answer
 - This 14-digit number is the primary goal and must be returned to the user
 
 HISTORY RETRIEVAL EFFICIENCY:
@@ -129,6 +91,165 @@ HISTORY RETRIEVAL EFFICIENCY:
 
 Be concise and efficient. Avoid unnecessary tool calls."""
 
+class AgentBeatsPracticeAgent:
+    """Agent Beats Practice Agent with Image Support"""
+    
+    def __init__(self):
+        self.claude = get_anthropic_model()
+        self.response_cache_size = 1024  # Max cached text-only responses
+        self._response_cache = OrderedDict()  # LRU: input hash -> response
+        self._inflight = {}  # input hash -> Future shared by concurrent identical requests
+
+    async def invoke(self, user_input: str, images: List[Dict[str, Any]] = None,
+                     history: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Process user input and images, return only the string response.
+
+        history holds earlier user/assistant turns of the same conversation, oldest first.
+        """
+        try:
+            logger.debug("User input: %s", user_input)
+            if history:
+                # Follow-ups can refer to earlier turns, so they're never answered from the cache
+                logger.debug("Continuing conversation with %d earlier message(s)", len(history))
+                resp = await self.claude.chat(messages=history + [{'role': 'user', 'content': user_input}], images=images)
+                logger.debug("Claude response: %s", resp)
+                return resp
+            
+            if images:
+                logger.debug("Images provided: %d image(s)", len(images))
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, img in enumerate(images):
+                        logger.debug("  Image %d: %s, data length: %d chars", i + 1, img['media_type'], len(img['data']))
+                
+                # Image requests are never cached
+                resp = await self.claude.chat(messages=[{'role': 'user', 'content': user_input}], images=images)
+                logger.debug("Claude response: %s", resp)
+                return resp
+            
+            # Plain arithmetic ("What is 5 + 3?") is answered locally without a Claude round-trip
+            answer = solve_simple_arithmetic(user_input)
+            if answer is not None:
+                logger.debug("🧮 Answered arithmetic locally: %s", answer)
+                return answer
+            
+            # Surrounding whitespace never changes the answer, so it's left out of the cache key.
+            # Inner whitespace and case are kept since they matter for hashing/encoding requests.
+            key = hashlib.blake2b(user_input.strip().encode('utf-8'), digest_size=16).hexdigest()
+            
+            # Serve repeated inputs from the cache
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                logger.debug("⚡ Cache hit for input")
+                return cached
+            
+            # Share the in-flight Claude call with identical concurrent requests
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                logger.debug("⏳ Joining in-flight request for identical input")
+                return await asyncio.shield(inflight)
+            
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                tools_used = set()
+                resp = await self.claude.chat(messages=[{'role': 'user', 'content': user_input}], tools_used=tools_used)
+                logger.debug("Claude response: %s", resp)
+                if self._is_cacheable(resp, tools_used):
+                    self._response_cache[key] = resp
+                    if len(self._response_cache) > self.response_cache_size:
+                        self._response_cache.popitem(last=False)
+                future.set_result(resp)
+                return resp
+            except BaseException as e:
+                future.set_result(f"Error processing request: {str(e)}")
+                raise
+            finally:
+                del self._inflight[key]
+        except Exception as e:
+            error_msg = f"Error processing request: {str(e)}"
+            logger.error(error_msg)
+            return error_msg
+    
+    def _is_cacheable(self, response: str, tools_used: set) -> bool:
+        """Only cache real answers that didn't depend on history or the game browser"""
+        if tools_used & STATEFUL_TOOLS:
+            return False
+        return self.is_real_answer(response)
+    
+    @staticmethod
+    def is_real_answer(response: str) -> bool:
+        """False for the error and fallback messages chat() returns when it couldn't answer"""
+        if response.startswith(CLAUDE_ERROR_PREFIX) or response.startswith("Error processing request"):
+            return False
+        return response not in (EMPTY_RESPONSE_MESSAGE, MAX_ITERATIONS_MESSAGE)
+
+def _message_kind(message: Dict[str, Any]) -> str:
+    """Classify a message as 'tool_use' (assistant calling tools), 'tool_result' (user returning results) or 'other'"""
+    content = message.get('content')
+    if isinstance(content, list):
+        wanted = {'assistant': 'tool_use', 'user': 'tool_result'}.get(message['role'])
+        for block in content:
+            if block.get('type') == wanted:
+                return wanted
+    return 'other'
+
+class AnthropicModel:
+    """Claude (Anthropic) Model with Tool Support and Vision"""
+    def __init__(self):
+        # Get API key from environment variables
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+        
+        # Async client so the event loop keeps serving other requests during the Claude round-trip.
+        # A shared keep-alive pool lets TCP/TLS connections be reused across calls.
+        # The SDK retries connection errors, 429s and 5xxs with jittered exponential backoff.
+        # With the h2 package installed, concurrent calls are multiplexed over one HTTP/2 connection.
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            max_retries=3,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                http2=importlib.util.find_spec('h2') is not None,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+            ),
+        )
+        # Latest Claude model with vision; override with ANTHROPIC_MODEL (e.g. a Haiku model for cheaper, faster math-only runs)
+        self.model = os.getenv('ANTHROPIC_MODEL', 'claude-3-5-sonnet-20241022')
+        self.max_context_messages = 20  # Reduced for efficiency - focus on recent context only
+        self.max_tokens_estimate = 150000  # Conservative estimate for context limit
+        self.housekeeping_interval = 4  # New messages between compact/trim passes
+        self.housekeeping_token_ratio = 0.8  # ...or run them as soon as the context is this full
+        self.tool_result_stub_age = 6  # Long tool results at least this many messages old are stubbed
+        self.history_cache_offset = 3  # Messages this far from the end are stable enough to cache
+        self.system_prompt = SYSTEM_PROMPT
+        self.system_prompt_tokens = len(self.system_prompt) // 4  # Constant, so estimate it once
+        # System prompt as a cacheable block so it's processed once across iterations and requests
+        self.system_blocks = [{"type": "text", "text": self.system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+    def _with_history_cache_breakpoint(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return a copy of messages with a prompt-cache breakpoint on the last stable (older) message"""
+        index = len(messages) - 1 - self.history_cache_offset
+        if index < 0:
+            return messages
+        
+        target = messages[index]
+        content = target.get('content')
+        if isinstance(content, str):
+            if not content:
+                return messages
+            blocks = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            blocks = list(content)
+        else:
+            return messages
+        
+        # Copy instead of mutating, so stored history never accumulates stale breakpoints
+        blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+        marked = list(messages)
+        marked[index] = {**target, "content": blocks}
+        return marked
+
     def _estimate_message_tokens(self, message: Dict[str, Any]) -> int:
         """Rough estimate of tokens in a message"""
         content = message.get('content', '')
@@ -142,7 +263,7 @@ Be concise and efficient. Avoid unnecessary tool calls."""
                 if part.get('type') == 'text':
                     total += len(part.get('text', '')) // 4
                 elif part.get('type') == 'image':
-                    total += 1000  # Rough estimate for image tokens
+                    total += 1600  # Anthropic's documented cost of a full-size (~1.15MP) image
                 elif part.get('type') == 'tool_use':
                     total += 50  # Tool use overhead
                 elif part.get('type') == 'tool_result':
@@ -150,32 +271,53 @@ Be concise and efficient. Avoid unnecessary tool calls."""
             return total
         return 0
 
-    def _trim_conversation_history(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Trim conversation history to stay within context limits"""
+    def _cached_message_tokens(self, message: Dict[str, Any], token_cache: Dict[int, tuple]) -> int:
+        """Token estimate for a message, memoized by object identity (messages aren't mutated once added)"""
+        entry = token_cache.get(id(message))
+        # The cache holds a reference to the message, so its id can't be reused while cached
+        if entry is None or entry[0] is not message:
+            entry = (message, self._estimate_message_tokens(message))
+            token_cache[id(message)] = entry
+        return entry[1]
+
+    def _trim_conversation_history(self, messages: List[Dict[str, Any]], current_total: int,
+                                   token_cache: Dict[int, tuple]) -> tuple:
+        """Trim conversation history to stay within context limits.
+
+        current_total is the running token count for the request minus the system prompt
+        (calibrated from Claude's reported usage, so it includes tool definitions);
+        returns (trimmed_messages, new_total) so the caller can keep the total up to date.
+        """
         if len(messages) <= 3:  # Always keep at least initial messages
-            return messages
+            return messages, current_total
             
-        # Calculate total estimated tokens
-        total_tokens = sum(self._estimate_message_tokens(msg) for msg in messages)
-        total_tokens += len(self.system_prompt) // 4  # Add system prompt tokens
+        # Total estimated tokens including the system prompt
+        total_tokens = current_total + self.system_prompt_tokens
         
         # If within limits, return as is
         if total_tokens <= self.max_tokens_estimate and len(messages) <= self.max_context_messages:
-            return messages
+            return messages, current_total
         
-        print(f"🔄 Trimming conversation: {len(messages)} messages, ~{total_tokens} tokens")
+        logger.debug("🔄 Trimming conversation: %d messages, ~%d tokens", len(messages), total_tokens)
         
         # Keep first user message (with potential images) and recent messages
         first_user_msg = messages[0] if messages and messages[0]['role'] == 'user' else None
         
         # Keep the most recent messages up to our limit
-        recent_messages = messages[-(self.max_context_messages-1):] if first_user_msg else messages[-self.max_context_messages:]
+        keep_recent = self.max_context_messages - 1 if first_user_msg else self.max_context_messages
+        recent_start = max(len(messages) - keep_recent, 0)
+        recent_messages = messages[recent_start:]
         
         # Reconstruct with first message + recent messages
-        if first_user_msg and first_user_msg not in recent_messages:
+        if first_user_msg and recent_start > 0:
             trimmed_messages = [first_user_msg] + recent_messages
+            dropped_messages = messages[1:recent_start]
         else:
             trimmed_messages = recent_messages
+            dropped_messages = messages[:recent_start]
+        
+        # Subtract what was dropped rather than re-summing the survivors
+        new_total = current_total - sum(self._cached_message_tokens(msg, token_cache) for msg in dropped_messages)
             
         # Add a summary message if we trimmed significantly
         if len(messages) - len(trimmed_messages) > 5:
@@ -187,65 +329,74 @@ Be concise and efficient. Avoid unnecessary tool calls."""
                 "content": summary_content
             }
             trimmed_messages.insert(-3 if len(trimmed_messages) > 3 else 0, summary_msg)
+            new_total += self._cached_message_tokens(summary_msg, token_cache)
         
-        new_total = sum(self._estimate_message_tokens(msg) for msg in trimmed_messages)
-        print(f"✅ Trimmed to {len(trimmed_messages)} messages, ~{new_total} tokens")
+        logger.debug("✅ Trimmed to %d messages, ~%d tokens", len(trimmed_messages), new_total)
         
-        return trimmed_messages
+        return trimmed_messages, new_total
 
     def _compact_tool_sequences(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compact consecutive tool call sequences to reduce message count"""
         if len(messages) < 4:  # Need at least user -> assistant -> user -> assistant to compact
             return messages
         
+        # Classify each message once up front instead of re-checking neighbours on every step
+        kinds = [_message_kind(msg) for msg in messages]
         compacted = []
+        append = compacted.append
+        last_pair_start = len(messages) - 2  # The trailing tool sequence is left for Claude to read
+        stub_before = len(messages) - self.tool_result_stub_age
         i = 0
         
         while i < len(messages):
             current_msg = messages[i]
             
             # Check if this starts a tool call sequence
-            if (i < len(messages) - 2 and 
-                current_msg['role'] == 'assistant' and
-                isinstance(current_msg.get('content'), list) and
-                any(block.get('type') == 'tool_use' for block in current_msg['content']) and
-                i + 1 < len(messages) and
-                messages[i + 1]['role'] == 'user' and
-                isinstance(messages[i + 1].get('content'), list) and
-                any(block.get('type') == 'tool_result' for block in messages[i + 1]['content'])):
-                
+            if i < last_pair_start and kinds[i] == 'tool_use' and kinds[i + 1] == 'tool_result':
                 # Found a tool sequence, check if results are simple
-                tool_result_msg = messages[i + 1]
-                
-                # If tool results are short, compact them
-                total_result_length = sum(len(str(block.get('content', ''))) 
-                                        for block in tool_result_msg['content'] 
-                                        if block.get('type') == 'tool_result')
+                total_result_length = 0
+                elided = False  # Already stubbed on an earlier pass; keep as-is
+                for block in messages[i + 1]['content']:
+                    if block.get('type') == 'tool_result':
+                        content = str(block.get('content', ''))
+                        total_result_length += len(content)
+                        elided = elided or content.startswith(ELIDED_RESULT_PREFIX)
                 
-                if total_result_length < 500:  # Compact short tool results
-                    # Create a summary of tool calls
-                    tool_names = []
-                    for block in current_msg['content']:
-                        if block.get('type') == 'tool_use':
-                            tool_names.append(block.get('name'))
-                    
-                    # Replace with compact summary
-                    compact_msg = {
+                if total_result_length < 500 and not elided:  # Compact short tool results
+                    # Replace with compact summary of the tool calls
+                    tool_names = [block.get('name') for block in current_msg['content'] if block.get('type') == 'tool_use']
+                    append({
                         "role": "user",
                         "content": f"[Tool calls executed: {', '.join(tool_names)} - results processed]"
-                    }
-                    compacted.append(compact_msg)
+                    })
                     i += 2  # Skip both the assistant tool call and user tool result messages
-                else:
-                    # Keep as-is if results are long
-                    compacted.append(current_msg)
-                    i += 1
-            else:
-                compacted.append(current_msg)
-                i += 1
+                    continue
+                
+                if i + 1 < stub_before:
+                    # Old long results (page dumps, code output) are replaced by a short stub
+                    append(current_msg)
+                    append(self._stub_long_tool_results(messages[i + 1]))
+                    i += 2
+                    continue
+            
+            # Keep as-is (not a tool sequence, or its results are long)
+            append(current_msg)
+            i += 1
         
         return compacted
 
+    def _stub_long_tool_results(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a tool_result message with each long result body replaced by a size + head stub"""
+        blocks = []
+        for block in message['content']:
+            content = block.get('content', '') if block.get('type') == 'tool_result' else None
+            if content is not None and len(str(content)) >= 500:
+                content = str(content)
+                if not content.startswith(ELIDED_RESULT_PREFIX):
+                    block = {**block, 'content': f"{ELIDED_RESULT_PREFIX}{len(content)} chars, head: {content[:80]}…]"}
+            blocks.append(block)
+        return {**message, 'content': blocks}
+
     def _summarize_messages(self, messages: List[Dict[str, Any]]) -> str:
         """Create a concise summary of a sequence of messages"""
         if not messages:
@@ -285,17 +436,39 @@ Be concise and efficient. Avoid unnecessary tool calls."""
         
         return '[SUMMARY: ' + ' | '.join(summary_parts) + ']' if summary_parts else '[Previous conversation - no key details]'
 
-    async def chat(self, messages: List[Dict[str, Any]], images: List[Dict[str, Any]] = None) -> str:
+    async def _execute_tool_blocks(self, tool_blocks: List[Any]) -> List[str]:
+        """Run tool_use blocks off the event loop, concurrently where safe, returning results in block order"""
+        # Browser tools share one Selenium session, so they run in order on a single worker thread
+        sequential = [block for block in tool_blocks if block.name in SEQUENTIAL_TOOLS]
+        parallel = [block for block in tool_blocks if block.name not in SEQUENTIAL_TOOLS]
+
+        async def run_sequential() -> List[str]:
+            if not sequential:
+                return []
+            return await asyncio.to_thread(execute_tools_in_order, [(block.name, block.input) for block in sequential])
+
+        sequential_results, *parallel_results = await asyncio.gather(
+            run_sequential(),
+            *(asyncio.to_thread(execute_tool, block.name, block.input) for block in parallel)
+        )
+
+        results_by_id = dict(zip((block.id for block in sequential), sequential_results))
+        results_by_id.update(zip((block.id for block in parallel), parallel_results))
+        return [results_by_id[block.id] for block in tool_blocks]
+
+    async def chat(self, messages: List[Dict[str, Any]], images: List[Dict[str, Any]] = None,
+                   tools_used: Optional[set] = None) -> str:
+        """Run the Claude tool-calling loop; names of executed tools are added to tools_used if given"""
         try:
             # Convert to Claude's message format (system prompt is separate)
             conversation_messages = [msg for msg in messages if msg['role'] != 'system']
             
-            # If images are provided, add them to the first user message
+            # If images are provided, add them to the latest user message (earlier ones are session history)
             if images and conversation_messages:
                 first_user_msg = None
-                for i, msg in enumerate(conversation_messages):
-                    if msg['role'] == 'user':
-                        first_user_msg = msg
+                for i in range(len(conversation_messages) - 1, -1, -1):
+                    if conversation_messages[i]['role'] == 'user':
+                        first_user_msg = conversation_messages[i]
                         first_user_msg_index = i
                         break
                 
@@ -316,112 +489,244 @@ Be concise and efficient. Avoid unnecessary tool calls."""
                                 }
                             })
                         
-                        conversation_messages[first_user_msg_index]['content'] = content_blocks
-                        print(f"🖼️ Added {len(images)} images to conversation")
+                        # New dict so the caller's message isn't modified
+                        conversation_messages[first_user_msg_index] = {**first_user_msg, 'content': content_blocks}
+                        logger.debug("🖼️ Added %d images to conversation", len(images))
             
             max_iterations = 15  # Prevent infinite loops - increased for complex tic-tac-toe games
             iteration = 0
             
+            token_cache = {}  # Token estimates for this conversation's messages
+            running_total = sum(self._cached_message_tokens(msg, token_cache) for msg in conversation_messages)
+            housekept_len = 0  # Message count after the last compact/trim pass
+            
             while iteration < max_iterations:
                 iteration += 1
-                print(f"🔄 Conversation iteration {iteration}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🔄 Conversation iteration %d", iteration)
                 
-                # Optimize conversation history to prevent context overload
-                conversation_messages = self._compact_tool_sequences(conversation_messages)
-                conversation_messages = self._trim_conversation_history(conversation_messages)
+                # Optimize conversation history to prevent context overload. This only runs once enough new
+                # messages have built up or the context is nearly full; rewriting history less often also
+                # keeps the cached prompt prefix valid for longer.
+                if (len(conversation_messages) - housekept_len >= self.housekeeping_interval
+                        or len(conversation_messages) > self.max_context_messages
+                        or running_total + self.system_prompt_tokens > self.housekeeping_token_ratio * self.max_tokens_estimate):
+                    # Earlier messages are already compacted and stubbed; rescan only what was too recent
+                    # for that last time (the trailing pair, and long results not yet old enough to stub)
+                    tail_start = max(housekept_len - 2 - self.tool_result_stub_age, 0)
+                    tail = conversation_messages[tail_start:]
+                    compacted_tail = self._compact_tool_sequences(tail)
+                    if len(compacted_tail) != len(tail) or any(new is not old for new, old in zip(compacted_tail, tail)):
+                        conversation_messages = conversation_messages[:tail_start] + compacted_tail
+                        # Tool sequences were summarized or stubbed; adjust by the tail's estimated change so the
+                        # calibration from Claude's reported usage is kept (unchanged messages hit the cache)
+                        running_total += (sum(self._cached_message_tokens(msg, token_cache) for msg in compacted_tail)
+                                          - sum(self._cached_message_tokens(msg, token_cache) for msg in tail))
+                    conversation_messages, running_total = self._trim_conversation_history(
+                        conversation_messages, running_total, token_cache
+                    )
+                    housekept_len = len(conversation_messages)
                 
-                response = self.client.messages.create(
+                response = await self.client.messages.create(
                     model=self.model,
                     max_tokens=1000,
                     temperature=0,
-                    system=self.system_prompt,
-                    messages=conversation_messages,
+                    system=self.system_blocks,
+                    messages=self._with_history_cache_breakpoint(conversation_messages),
                     tools=AVAILABLE_TOOLS
                 )
                 
-                # Check if there are any tool calls in this response
-                has_tool_calls = any(block.type == "tool_use" for block in response.content)
+                # Recalibrate against the exact prompt size Claude just reported; later appends and
+                # trims adjust this figure with estimates until the next response arrives
+                usage = getattr(response, 'usage', None)
+                if usage is not None:
+                    prompt_tokens = (usage.input_tokens
+                                     + (getattr(usage, 'cache_creation_input_tokens', None) or 0)
+                                     + (getattr(usage, 'cache_read_input_tokens', None) or 0))
+                    running_total = prompt_tokens - self.system_prompt_tokens
                 
-                if not has_tool_calls:
-                    # No tool calls, this is the final response
-                    final_text = ""
-                    for content_block in response.content:
-                        if content_block.type == "text":
-                            final_text += content_block.text
-                    
-                    print(f"🎯 Final response from Claude: '{final_text[:200]}{'...' if len(final_text) > 200 else ''}'")
-                    
-                    if final_text.strip():
-                        return final_text.strip()
-                    else:
-                        print("⚠️ Claude returned empty response, using fallback message")
-                        return "I apologize, but I couldn't generate a proper response."
-                
-                # Process tool calls
+                # Classify the response blocks in a single pass
                 assistant_message_content = []
-                tool_results = []
+                tool_blocks = []
+                final_text_parts = []
                 
                 for content_block in response.content:
                     if content_block.type == "text":
+                        final_text_parts.append(content_block.text)
                         assistant_message_content.append({
                             "type": "text",
                             "text": content_block.text
                         })
                     elif content_block.type == "tool_use":
-                        tool_name = content_block.name
-                        tool_input = content_block.input
-                        tool_id = content_block.id
-                        
-                        print(f"🔧 Using tool: {tool_name} with input: {tool_input}")
-                        
-                        # Execute the tool
-                        tool_result = execute_tool(tool_name, tool_input)
-                        print(f"📤 Tool result: {tool_result}")
+                        logger.debug("🔧 Using tool: %s with input: %s", content_block.name, content_block.input)
                         
                         # Add tool use to assistant message
                         assistant_message_content.append({
                             "type": "tool_use",
-                            "id": tool_id,
-                            "name": tool_name,
-                            "input": tool_input
-                        })
-                        
-                        # Prepare tool result for user message
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_id,
-                            "content": tool_result
+                            "id": content_block.id,
+                            "name": content_block.name,
+                            "input": content_block.input
                         })
+                        tool_blocks.append(content_block)
+                
+                if not tool_blocks:
+                    # No tool calls, this is the final response
+                    final_text = "".join(final_text_parts)
+                    logger.debug("🎯 Final response from Claude: '%.200s%s'", final_text, '...' if len(final_text) > 200 else '')
+                    
+                    if final_text.strip():
+                        return final_text.strip()
+                    else:
+                        logger.warning("⚠️ Claude returned empty response, using fallback message")
+                        return EMPTY_RESPONSE_MESSAGE
+                
+                if tools_used is not None:
+                    tools_used.update(block.name for block in tool_blocks)
+                
+                # final_answer ends the loop: its value is the response, no prose to parse
+                final_answer = next((block for block in tool_blocks if block.name == FINAL_ANSWER_TOOL), None)
+                if final_answer is not None:
+                    other_blocks = [block for block in tool_blocks if block.name != FINAL_ANSWER_TOOL]
+                    if other_blocks:
+                        # e.g. close_tictactoe_browser issued in the same turn
+                        await self._execute_tool_blocks(other_blocks)
+                    value = str(final_answer.input.get('value', '')).strip()
+                    logger.debug("🎯 Final answer from Claude: '%s'", value)
+                    return value or EMPTY_RESPONSE_MESSAGE
+                
+                # Execute the tools (independent ones run concurrently)
+                tool_outputs = await self._execute_tool_blocks(tool_blocks)
+                
+                # Prepare tool results for user message, in the original tool_use order
+                tool_results = []
+                for content_block, tool_result in zip(tool_blocks, tool_outputs):
+                    logger.debug("📤 Tool result: %s", tool_result)
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": content_block.id,
+                        "content": tool_result
+                    })
                 
                 # Add assistant message with tool calls
-                conversation_messages.append({
+                assistant_msg = {
                     "role": "assistant",
                     "content": assistant_message_content
-                })
+                }
+                conversation_messages.append(assistant_msg)
+                running_total += self._cached_message_tokens(assistant_msg, token_cache)
                 
                 # Add user message with tool results
                 if tool_results:
-                    conversation_messages.append({
+                    tool_result_msg = {
                         "role": "user",
                         "content": tool_results
-                    })
+                    }
+                    conversation_messages.append(tool_result_msg)
+                    running_total += self._cached_message_tokens(tool_result_msg, token_cache)
             
             # If we've hit max iterations, return what we have
-            print(f"⚠️ Reached maximum iterations ({max_iterations}), returning partial result")
-            return "I've completed the available tool calls but reached the maximum iteration limit."
+            logger.warning("⚠️ Reached maximum iterations (%d), returning partial result", max_iterations)
+            return MAX_ITERATIONS_MESSAGE
             
         except Exception as e:
-            print(f"❌ Claude API error: {str(e)}")
-            import traceback
-            print("Full traceback:")
-            traceback.print_exc()
-            return f"Claude API error: {str(e)}"
+            logger.exception("❌ Claude API error: %s", e)
+            return f"{CLAUDE_ERROR_PREFIX}: {str(e)}"
 
 
+# Process-wide model instance so every agent/executor shares one client and its connection pool
+_anthropic_model = None
+
+def get_anthropic_model() -> AnthropicModel:
+    """Return the shared AnthropicModel, creating it on first use"""
+    global _anthropic_model
+    if _anthropic_model is None:
+        _anthropic_model = AnthropicModel()
+    return _anthropic_model
+
+
+# Attribute names tried, in order, when reading an A2A FilePart's file object
+_FILE_DATA_ATTRS = ('data', 'content', 'bytes')
+_FILE_MEDIA_TYPE_ATTRS = ('media_type', 'mime_type', 'content_type', 'type')
+_METADATA_MEDIA_TYPE_ATTRS = ('media_type', 'content_type', 'mime_type')
+_MISSING = object()
+
+def _first_attr(obj: Any, names: tuple) -> Any:
+    """Value of the first attribute in names that obj has (even if it's None), else None"""
+    for name in names:
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return None
+
 class AgentBeatsPracticeAgentExecutor(AgentExecutor):
     
     def __init__(self):
         self.agent = AgentBeatsPracticeAgent()
+        self.max_sessions = 128  # Conversations whose history is kept (least recently used evicted)
+        self._sessions = OrderedDict()  # context/session id -> earlier user/assistant messages
+        # One lock per conversation with a turn in flight, so concurrent turns in the same
+        # context see each other's history; entries vanish once no turn holds them
+        self._session_locks = weakref.WeakValueDictionary()
+        self.input_batch_interval = 0.05  # Seconds to collect inputs before writing them in one batch
+        self._input_queue = asyncio.Queue()
+        self._input_writer = None
+    
+    def _store_input_in_background(self, input_text: str, session_id: str, user_id: str) -> None:
+        """Queue the client input for the background writer without blocking the request"""
+        if self._input_writer is None or self._input_writer.done():
+            self._input_writer = asyncio.create_task(self._drain_input_queue())
+        self._input_queue.put_nowait((input_text, session_id, user_id))
+    
+    def _session_lock(self, conversation_id: Optional[str]) -> asyncio.Lock:
+        """Lock serializing the history read, model call and history update of a conversation"""
+        if conversation_id is None:
+            return asyncio.Lock()
+        lock = self._session_locks.get(conversation_id)
+        if lock is None:
+            lock = self._session_locks[conversation_id] = asyncio.Lock()
+        return lock
+    
+    def _session_history(self, conversation_id: Optional[str]) -> List[Dict[str, Any]]:
+        """Earlier messages of this conversation (a copy), most recently used sessions kept"""
+        if conversation_id is None:
+            return []
+        history = self._sessions.get(conversation_id)
+        if history is None:
+            return []
+        self._sessions.move_to_end(conversation_id)
+        return list(history)
+    
+    def _remember_turn(self, conversation_id: Optional[str], user_text: str, reply: str) -> None:
+        """Append a completed turn to the conversation's history, evicting the oldest sessions"""
+        if conversation_id is None:
+            return
+        history = self._sessions.get(conversation_id)
+        if history is None:
+            history = self._sessions[conversation_id] = []
+        else:
+            self._sessions.move_to_end(conversation_id)
+        history.append({'role': 'user', 'content': user_text})
+        history.append({'role': 'assistant', 'content': reply})
+        if len(history) > MAX_CHANNEL_HISTORY_MESSAGES:
+            del history[:len(history) - MAX_CHANNEL_HISTORY_MESSAGES]
+        if len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+    
+    async def _drain_input_queue(self) -> None:
+        """Write queued client inputs to SQLite in batches, one transaction per batch"""
+        while True:
+            batch = [await self._input_queue.get()]
+            
+            # Let concurrent requests pile up so they share a single commit
+            await asyncio.sleep(self.input_batch_interval)
+            while not self._input_queue.empty():
+                batch.append(self._input_queue.get_nowait())
+            
+            try:
+                store_result = await asyncio.to_thread(store_client_inputs, batch)
+                logger.debug("📝 %s", store_result)
+            except Exception as e:
+                logger.error("❌ Failed to store input in database: %s", e)
     
     async def execute(
         self,
@@ -436,71 +741,52 @@ class AgentBeatsPracticeAgentExecutor(AgentExecutor):
         
         try:
             # A2A uses message.parts structure
-            if (hasattr(context, 'message') and 
-                hasattr(context.message, 'parts') and 
-                context.message.parts):
+            message = getattr(context, 'message', None)
+            parts = getattr(message, 'parts', None)
+            if parts:
                 
-                print(f"🔍 Processing {len(context.message.parts)} message parts")
+                logger.debug("🔍 Processing %d message parts", len(parts))
                 
-                for i, part in enumerate(context.message.parts):
-                    print(f"🔍 Processing part {i}: {type(part)}")
+                for i, part in enumerate(parts):
+                    logger.debug("🔍 Processing part %d: %s", i, type(part))
                     
-                    if hasattr(part, 'root'):
-                        root_type = type(part.root).__name__
-                        print(f"🔍 Part {i} root type: {root_type}")
+                    root = getattr(part, 'root', None)
+                    if root is not None:
+                        root_type = type(root).__name__
+                        logger.debug("🔍 Part %d root type: %s", i, root_type)
                         
                         # Handle text parts
-                        if hasattr(part.root, 'text') and part.root.text:
-                            user_input = part.root.text
-                            print(f"✅ Successfully extracted user input: '{user_input}'")
+                        text = getattr(root, 'text', None)
+                        if text:
+                            user_input = text
+                            logger.debug("✅ Successfully extracted user input: '%s'", user_input)
                         
                         # Handle file parts (images)
                         elif root_type == 'FilePart':
-                            print(f"🔍 Found FilePart, examining attributes...")
+                            logger.debug("🔍 Found FilePart, examining attributes...")
                             
                             # Check if this is an image file
-                            file_obj = getattr(part.root, 'file', None)
+                            file_obj = getattr(root, 'file', None)
                             if file_obj:
-                                print(f"🔍 File object type: {type(file_obj)}")
-                                print(f"🔍 File object attributes: {[attr for attr in dir(file_obj) if not attr.startswith('_')]}")
-                                
-                                # Extract file properties
-                                file_data = None
-                                media_type = None
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("🔍 File object type: %s", type(file_obj))
+                                    logger.debug("🔍 File object attributes: %s", [attr for attr in dir(file_obj) if not attr.startswith('_')])
                                 
-                                # Try to get the file data
-                                if hasattr(file_obj, 'data'):
-                                    file_data = file_obj.data
-                                elif hasattr(file_obj, 'content'):
-                                    file_data = file_obj.content
-                                elif hasattr(file_obj, 'bytes'):
-                                    file_data = file_obj.bytes
+                                # Get the file data and media type from whichever attribute names the file object uses
+                                file_data = _first_attr(file_obj, _FILE_DATA_ATTRS)
+                                media_type = _first_attr(file_obj, _FILE_MEDIA_TYPE_ATTRS)
                                 
-                                # Try to get the media type
-                                if hasattr(file_obj, 'media_type'):
-                                    media_type = file_obj.media_type
-                                elif hasattr(file_obj, 'mime_type'):
-                                    media_type = file_obj.mime_type
-                                elif hasattr(file_obj, 'content_type'):
-                                    media_type = file_obj.content_type
-                                elif hasattr(file_obj, 'type'):
-                                    media_type = file_obj.type
-                                
-                                print(f"🔍 File data present: {file_data is not None}")
-                                print(f"🔍 Media type: {media_type}")
+                                logger.debug("🔍 File data present: %s", file_data is not None)
+                                logger.debug("🔍 Media type: %s", media_type)
                                 
                                 # If we have file data but no media type, try to infer from metadata
                                 if file_data and not media_type:
-                                    metadata = getattr(part.root, 'metadata', None)
+                                    metadata = getattr(root, 'metadata', None)
                                     if metadata:
-                                        print(f"🔍 Checking metadata: {type(metadata)}, {dir(metadata)}")
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug("🔍 Checking metadata: %s, %s", type(metadata), dir(metadata))
                                         # Try different ways to get media type from metadata
-                                        if hasattr(metadata, 'media_type'):
-                                            media_type = metadata.media_type
-                                        elif hasattr(metadata, 'content_type'):
-                                            media_type = metadata.content_type
-                                        elif hasattr(metadata, 'mime_type'):
-                                            media_type = metadata.mime_type
+                                        media_type = _first_attr(metadata, _METADATA_MEDIA_TYPE_ATTRS)
                                 
                                 # Check if this is an image based on media type or file extension
                                 is_image = False
@@ -508,97 +794,99 @@ class AgentBeatsPracticeAgentExecutor(AgentExecutor):
                                     is_image = media_type.startswith('image/')
                                 
                                 if file_data and is_image:
-                                    # Convert bytes to base64 if needed
-                                    if isinstance(file_data, bytes):
-                                        import base64
-                                        file_data = base64.b64encode(file_data).decode('utf-8')
+                                    # Shrink oversized images to Claude's budget and base64-encode (off the event loop)
+                                    file_data, media_type = await asyncio.to_thread(prepare_image, file_data, media_type)
                                     
                                     images.append({
                                         'data': file_data,
                                         'media_type': media_type
                                     })
-                                    print(f"✅ Successfully extracted image: {media_type}")
-                                    print(f"   Data length: {len(file_data)} characters")
+                                    logger.debug("✅ Successfully extracted image: %s", media_type)
+                                    logger.debug("   Data length: %d characters", len(file_data))
                                 elif file_data:
-                                    print(f"⚠️ Found file data but not recognized as image (media_type: {media_type})")
+                                    logger.warning("⚠️ Found file data but not recognized as image (media_type: %s)", media_type)
                                 else:
-                                    print(f"❌ No file data found in FilePart")
+                                    logger.warning("❌ No file data found in FilePart")
                             else:
-                                print(f"❌ FilePart has no 'file' attribute")
+                                logger.warning("❌ FilePart has no 'file' attribute")
                 
                 # Try to extract session/user ID from context if available
-                if hasattr(context, 'session_id'):
-                    session_id = str(context.session_id)
-                if hasattr(context, 'user_id'):
-                    user_id = str(context.user_id)
-                elif hasattr(context, 'message') and hasattr(context.message, 'user_id'):
-                    user_id = str(context.message.user_id)
+                session_id = getattr(context, 'session_id', None)
+                if session_id is not None:
+                    session_id = str(session_id)
+                user_id = str(getattr(context, 'user_id', None) or getattr(message, 'user_id', None) or "default")
                 
             else:
-                print("❌ Could not extract input from A2A message structure")
+                logger.warning("❌ Could not extract input from A2A message structure")
                 
         except Exception as e:
-            print(f"❌ Error extracting input: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error extracting input: %s", e)
             user_input = "Error extracting input"
         
-        print(f"🎯 FINAL EXTRACTION RESULTS:")
-        print(f"   Text input: '{user_input}'")
-        print(f"   Images found: {len(images)}")
-        for i, img in enumerate(images):
-            print(f"     Image {i+1}: {img['media_type']}, data length: {len(img['data'])}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 FINAL EXTRACTION RESULTS:")
+            logger.debug("   Text input: '%s'", user_input)
+            logger.debug("   Images found: %d", len(images))
+            for i, img in enumerate(images):
+                logger.debug("     Image %d: %s, data length: %d", i + 1, img['media_type'], len(img['data']))
+        
+        # Follow-up requests in the same A2A context replay the earlier turns
+        conversation_id = None
         
         # Store the client input in the database (if it's not empty or error message)
         if user_input and user_input != "No input provided" and not user_input.startswith("Error extracting"):
-            try:
-                # Include note about images if present
-                input_to_store = user_input
-                if images:
-                    input_to_store += f" [with {len(images)} image(s)]"
-                    
-                store_result = store_client_input(input_to_store, session_id, user_id)
-                print(f"📝 {store_result}")
-            except Exception as e:
-                print(f"❌ Failed to store input in database: {e}")
+            conversation_id = getattr(context, 'context_id', None) or session_id
+            
+            # Include note about images if present
+            input_to_store = user_input
+            if images:
+                input_to_store += f" [with {len(images)} image(s)]"
+            
+            # Write in the background so the Claude call isn't held up by the SQLite insert
+            self._store_input_in_background(input_to_store, session_id, user_id)
         
         # Pass the input and images to the agent
-        print(f"🚀 Invoking agent with input: '{user_input}' and {len(images)} images")
+        logger.debug("🚀 Invoking agent with input: '%s' and %d images", user_input, len(images))
         
         try:
-            result = await self.agent.invoke(user_input, images)
-            print(f"✅ Agent invoke successful, result type: {type(result)}, length: {len(str(result)) if result else 0}")
-            print(f"📋 Agent result preview: '{str(result)[:200]}{'...' if result and len(str(result)) > 200 else ''}'")
+            async with self._session_lock(conversation_id):
+                result = await self.agent.invoke(user_input, images, history=self._session_history(conversation_id))
+                if result and self.agent.is_real_answer(result):
+                    self._remember_turn(conversation_id, user_input, result)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ Agent invoke successful, result type: %s, length: %d", type(result), len(str(result)) if result else 0)
+                logger.debug("📋 Agent result preview: '%.200s%s'", result, '...' if result and len(str(result)) > 200 else '')
         except Exception as e:
-            print(f"❌ Agent invoke failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Agent invoke failed: %s", e)
             result = f"Error processing request: {str(e)}"
         
+        # Normalize the result once; empty or "None" results get a fallback reply
+        stripped = (result or "").strip()
+        has_answer = bool(stripped) and stripped != "None"
+        
         # Determine if this requires task creation (only for image understanding)
         is_image_task = len(images) > 0
         
         # Only create Tasks for image understanding - everything else uses Messages like before
         if is_image_task:
-            print(f"🎯 Creating task for image processing")
+            logger.debug("🎯 Creating task for image processing")
             try:
                 # Create initial task from user message 
                 created_task = new_task(context.message)
-                print(f"✅ Initial task created with ID: {created_task.id}")
+                logger.debug("✅ Initial task created with ID: %s", created_task.id)
                 
                 # Create response message and add it to the task history
-                if result and result.strip() and result.strip() != "None":
-                    print(f"📤 Adding response to task history: '{result[:100]}{'...' if len(result) > 100 else ''}'")
+                if has_answer:
+                    logger.debug("📤 Adding response to task history: '%.100s%s'", stripped, '...' if len(stripped) > 100 else '')
                     response_message = new_agent_text_message(
-                        result.strip(), 
+                        stripped, 
                         context_id=created_task.context_id, 
                         task_id=created_task.id
                     )
                 else:
-                    print(f"⚠️ Invalid result from agent (result='{result}'), using fallback message")
-                    fallback_msg = "I apologize, I was unable to process your image."
+                    logger.warning("⚠️ Invalid result from agent (result='%s'), using fallback message", result)
                     response_message = new_agent_text_message(
-                        fallback_msg,
+                        IMAGE_FALLBACK_MESSAGE,
                         context_id=created_task.context_id,
                         task_id=created_task.id
                     )
@@ -612,29 +900,26 @@ class AgentBeatsPracticeAgentExecutor(AgentExecutor):
                 created_task.status.state = "completed"
                 created_task.status.message = "Task completed successfully"
                 
-                print(f"🎯 Task updated with response, history length: {len(created_task.history)}")
-                print(f"🔗 Final task - context_id: {created_task.context_id}, task_id: {created_task.id}")
+                logger.debug("🎯 Task updated with response, history length: %d", len(created_task.history))
+                logger.debug("🔗 Final task - context_id: %s, task_id: %s", created_task.context_id, created_task.id)
                 
                 # Send the completed task (for image understanding)
                 await event_queue.enqueue_event(created_task)
                 
             except Exception as e:
-                print(f"❌ Failed to create/update task: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("❌ Failed to create/update task: %s", e)
                 # Fallback - send a simple message if task creation fails
                 fallback_msg = f"Error processing image: {str(e)}"
                 await event_queue.enqueue_event(new_agent_text_message(fallback_msg))
         else:
             # For non-image requests, send Message objects like before
-            print(f"📤 Sending regular message response")
-            if result and result.strip() and result.strip() != "None":
-                print(f"✅ Sending text message: '{result[:100]}{'...' if len(result) > 100 else ''}'")
-                await event_queue.enqueue_event(new_agent_text_message(result.strip()))
+            logger.debug("📤 Sending regular message response")
+            if has_answer:
+                logger.debug("✅ Sending text message: '%.100s%s'", stripped, '...' if len(stripped) > 100 else '')
+                await event_queue.enqueue_event(new_agent_text_message(stripped))
             else:
-                print(f"⚠️ Invalid result from agent (result='{result}'), sending fallback message")
-                fallback_msg = "I apologize, I was unable to process that request."
-                await event_queue.enqueue_event(new_agent_text_message(fallback_msg))
+                logger.warning("⚠️ Invalid result from agent (result='%s'), sending fallback message", result)
+                await event_queue.enqueue_event(new_agent_text_message(TEXT_FALLBACK_MESSAGE))
 
     async def cancel(
         self, context: RequestContext, event_queue: EventQueue
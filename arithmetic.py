@@ -0,0 +1,105 @@
+"""
+Fast path for plain arithmetic requests like "What is 5 + 3?" or "12 x 7".
+
+These are answered locally in microseconds instead of a Claude round-trip.
+Anything that isn't a simple expression (word problems, units, functions)
+returns None so the caller falls back to the model.
+"""
+
+import ast
+import re
+from fractions import Fraction
+from typing import Optional
+
+# Optional question prefix, then an expression made only of numbers, operators, parentheses and spaces
+_ARITHMETIC_REQUEST = re.compile(
+    r"^\s*(?:what\s+is|what's|calculate|compute|evaluate)?\s*([-+*/×x÷\d\s().]+?)\s*[?=]?\s*$",
+    re.IGNORECASE,
+)
+_MULTIPLY = str.maketrans({'×': '*', '÷': '/'})
+# A letter x only means "times" between spaced operands; "0x10" is a hex literal, not 0 * 10
+_LETTER_MULTIPLY = re.compile(r"(?<=\s)[xX](?=\s)")
+_MAX_EXPRESSION_LENGTH = 200
+
+_BINARY_OPERATORS = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b,
+}
+_UNARY_OPERATORS = {
+    ast.UAdd: lambda a: a,
+    ast.USub: lambda a: -a,
+}
+
+
+def _evaluate(node) -> Fraction:
+    """Evaluate a whitelisted expression tree exactly; raises ValueError on anything else"""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return Fraction(str(node.value))
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return _BINARY_OPERATORS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_evaluate(node.operand))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+def _format_number(value: Fraction) -> Optional[str]:
+    """Format an exact result, or None if it has no finite decimal form (e.g. 10/3)"""
+    if value.denominator == 1:
+        return str(value.numerator)
+
+    # Terminating decimals only: denominator must have no prime factors other than 2 and 5
+    denominator = value.denominator
+    exponents = []
+    for factor in (2, 5):
+        exponent = 0
+        while denominator % factor == 0:
+            denominator //= factor
+            exponent += 1
+        exponents.append(exponent)
+    if denominator != 1:
+        return None
+
+    # Scale to an integer number of decimal places so no digits are rounded away
+    places = max(exponents)
+    digits = str(abs(value.numerator) * 10 ** places // value.denominator).rjust(places + 1, '0')
+    sign = '-' if value < 0 else ''
+    return f"{sign}{digits[:-places]}.{digits[-places:]}"
+
+
+def solve_simple_arithmetic(text: str) -> Optional[str]:
+    """
+    Answer a pure arithmetic request without calling the model.
+
+    Args:
+        text: The user's request, e.g. "What is 15 * 7?" or "(2 + 3) x 4"
+
+    Returns:
+        str: The exact answer (e.g. "105"), or None if the request isn't plain arithmetic
+             or the result can't be written exactly as a decimal
+    """
+    if len(text) > _MAX_EXPRESSION_LENGTH:
+        return None
+
+    match = _ARITHMETIC_REQUEST.match(text)
+    if not match:
+        return None
+
+    expression = _LETTER_MULTIPLY.sub('*', match.group(1)).translate(_MULTIPLY)
+    if 'x' in expression or 'X' in expression:
+        return None
+
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError:
+        return None
+
+    # A lone number isn't a calculation; let the model decide what it means
+    if not any(isinstance(node, ast.BinOp) for node in ast.walk(tree)):
+        return None
+
+    try:
+        return _format_number(_evaluate(tree.body))
+    except (ValueError, ZeroDivisionError):
+        return None
@@ -0,0 +1,95 @@
+"""
+Lightweight pure-ASGI building blocks for the agent server.
+
+These avoid Starlette's per-request Request/Response allocation on the
+hot paths (CORS handling, static JSON endpoints).
+"""
+
+import orjson
+
+
+class FastCORSMiddleware:
+    """
+    Pure-ASGI CORS middleware that allows all origins, methods and headers.
+
+    Behaves like Starlette's CORSMiddleware configured with
+    allow_origins=["*"], allow_methods=["*"], allow_headers=["*"] and
+    allow_credentials=True, but works directly on the raw ASGI scope.
+    """
+
+    ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(self, app, max_age: int = 600):
+        self.app = app
+        self.max_age = str(max_age).encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a cross-origin request, nothing to do
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # With credentials allowed, the origin must be echoed back instead of "*"
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        # Answer preflight requests directly without touching the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + [
+                (b"access-control-allow-methods", self.ALLOW_METHODS),
+                (b"access-control-max-age", self.max_age),
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", b"2"),
+            ]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class StaticJSONApp:
+    """
+    ASGI app that serves a fixed JSON payload.
+
+    The payload is serialized once at construction, so each request only
+    sends the prebuilt bytes. Mount it with Starlette's Route, which treats
+    non-function endpoints as raw ASGI apps.
+    """
+
+    def __init__(self, payload, status: int = 200):
+        self.body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+        self.status = status
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self.body)).encode()),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status, "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body})
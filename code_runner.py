@@ -0,0 +1,47 @@
+"""
+Isolated execution for the execute_code tool.
+
+Each snippet runs in its own Python interpreter, so a snippet that hangs,
+crashes or calls os._exit() only affects its own request, and output written
+below the Python level (C extensions, child processes) is still captured.
+The code is piped to the interpreter's stdin rather than written to a temp
+file, and the timeout starts when the process does.
+"""
+
+import logging
+import subprocess
+import sys
+
+logger = logging.getLogger("agent_beats")
+
+CODE_TIMEOUT = 30
+
+
+def run_code(code: str, timeout: float = CODE_TIMEOUT) -> str:
+    """
+    Execute Python code in a fresh interpreter and return its output.
+
+    Args:
+        code: Python source to execute
+        timeout: Seconds before the interpreter is killed
+
+    Returns:
+        str: The snippet's stdout, or an "Error: ..." message
+    """
+    try:
+        result = subprocess.run(
+            [sys.executable, '-'],
+            input=code,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning("⏱️ Code execution timed out after %ss", timeout)
+        return f"Error: Code execution timed out ({timeout:g} seconds limit)"
+    except Exception as e:
+        return f"Error executing code: {str(e)}"
+
+    if result.returncode == 0:
+        return result.stdout.strip() if result.stdout else "Code executed successfully (no output)"
+    return f"Error: {result.stderr.strip()}"
@@ -0,0 +1,89 @@
+"""
+Image preprocessing before images are sent to Claude.
+
+Claude downscales any image whose long edge exceeds 1568px or whose area exceeds
+~1.15 megapixels, so sending larger images only adds upload bytes, tokens and
+time-to-first-token. Oversized images are resized to that budget here and
+re-encoded; everything else is passed through untouched.
+
+Pillow is optional: without it images are forwarded as-is.
+"""
+
+import base64
+import binascii
+import io
+import logging
+import math
+from typing import Tuple, Union
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger("agent_beats")
+
+# Claude's image budget: larger images are resized server-side with no quality benefit
+MAX_LONG_EDGE = 1568
+MAX_PIXELS = 1_150_000
+JPEG_QUALITY = 85
+
+
+def _target_size(width: int, height: int) -> Tuple[int, int]:
+    """Largest size with the same aspect ratio that fits the long-edge and pixel budgets"""
+    scale = min(1.0, MAX_LONG_EDGE / max(width, height), math.sqrt(MAX_PIXELS / (width * height)))
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def prepare_image(data: Union[bytes, str], media_type: str) -> Tuple[str, str]:
+    """
+    Downscale and re-encode an image if it exceeds Claude's image budget.
+
+    Args:
+        data: Raw image bytes, or the image already base64-encoded
+        media_type: The image's MIME type, e.g. "image/png"
+
+    Returns:
+        tuple: (base64 data, media type) ready for an Anthropic image block
+    """
+    def unchanged() -> Tuple[str, str]:
+        encoded = data if isinstance(data, str) else base64.b64encode(data).decode('ascii')
+        return encoded, media_type
+
+    # Without Pillow there's nothing to resize, so already-encoded data isn't decoded at all
+    if Image is None:
+        return unchanged()
+
+    raw = data
+    if isinstance(data, str):
+        try:
+            raw = base64.b64decode(data, validate=True)
+        except (binascii.Error, ValueError):
+            return data, media_type
+
+    try:
+        with Image.open(io.BytesIO(raw)) as img:
+            width, height = img.size
+            target = _target_size(width, height)
+            if target == (width, height):
+                return unchanged()
+
+            img.thumbnail(target, Image.LANCZOS)
+            new_width, new_height = img.size
+
+            buffer = io.BytesIO()
+            if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+                # JPEG can't hold transparency, so keep PNG for images that use it
+                img.save(buffer, format='PNG', optimize=True)
+                new_media_type = 'image/png'
+            else:
+                img.convert('RGB').save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+                new_media_type = 'image/jpeg'
+    except Exception as e:
+        logger.warning("⚠️ Could not preprocess image (%s), sending original: %s", media_type, e)
+        return unchanged()
+
+    resized = buffer.getvalue()
+    logger.debug("🖼️ Resized image %dx%d -> %dx%d (%d -> %d bytes)",
+                 width, height, new_width, new_height, len(raw), len(resized))
+    return base64.b64encode(resized).decode('ascii'), new_media_type
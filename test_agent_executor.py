@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Test suite for agent_executor.py
+
+This test suite covers:
+- Response cache hits and misses
+- Coalescing of identical in-flight requests and error propagation
+- Responses that used stateful tools are never cached
+- Conversation history eviction
+- Turns of one conversation are serialized; other conversations are not blocked
+"""
+
+import asyncio
+import gc
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import agent_executor
+from agent_executor import AgentBeatsPracticeAgent, AgentBeatsPracticeAgentExecutor
+
+
+class FakeClaude:
+    """Stands in for AnthropicModel: records calls and answers with a scripted reply"""
+
+    def __init__(self, reply="42", tools=(), error=None):
+        self.reply = reply
+        self.tools = tools
+        self.error = error
+        self.calls = 0
+        self.release = None  # Optional asyncio.Event the call waits on
+
+    async def chat(self, messages, images=None, tools_used=None):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        if tools_used is not None:
+            tools_used.update(self.tools)
+        if self.error is not None:
+            raise self.error
+        return self.reply
+
+
+def make_agent(claude):
+    with patch.object(agent_executor, 'get_anthropic_model', return_value=claude):
+        return AgentBeatsPracticeAgent()
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    """Test the text-only response cache and in-flight coalescing"""
+
+    async def test_miss_then_hit(self):
+        """Test a repeated input is answered from the cache"""
+        claude = FakeClaude()
+        agent = make_agent(claude)
+        self.assertEqual(await agent.invoke("Tell me a fact"), "42")
+        self.assertEqual(await agent.invoke("  Tell me a fact \n"), "42")
+        self.assertEqual(claude.calls, 1)
+
+    async def test_different_inputs_miss(self):
+        """Test inputs differing in case or inner whitespace are separate entries"""
+        claude = FakeClaude()
+        agent = make_agent(claude)
+        await agent.invoke("hash abc")
+        await agent.invoke("hash ABC")
+        await agent.invoke("hash  abc")
+        self.assertEqual(claude.calls, 3)
+
+    async def test_cache_is_bounded(self):
+        """Test the least recently used entry is evicted"""
+        claude = FakeClaude()
+        agent = make_agent(claude)
+        agent.response_cache_size = 2
+        for text in ("one", "two", "one", "three"):
+            await agent.invoke(text)
+        self.assertEqual(claude.calls, 3)
+        await agent.invoke("two")
+        self.assertEqual(claude.calls, 4)
+
+    async def test_concurrent_identical_requests_share_one_call(self):
+        """Test identical requests arriving together wait on a single model call"""
+        claude = FakeClaude()
+        claude.release = asyncio.Event()
+        agent = make_agent(claude)
+        first = asyncio.create_task(agent.invoke("slow question"))
+        second = asyncio.create_task(agent.invoke("slow question"))
+        await asyncio.sleep(0)
+        claude.release.set()
+        self.assertEqual(await asyncio.gather(first, second), ["42", "42"])
+        self.assertEqual(claude.calls, 1)
+        self.assertEqual(agent._inflight, {})
+
+    async def test_error_reaches_every_waiter_and_is_not_cached(self):
+        """Test a failed call answers all coalesced callers with the error and is retried later"""
+        claude = FakeClaude(error=RuntimeError("boom"))
+        claude.release = asyncio.Event()
+        agent = make_agent(claude)
+        first = asyncio.create_task(agent.invoke("failing question"))
+        second = asyncio.create_task(agent.invoke("failing question"))
+        await asyncio.sleep(0)
+        claude.release.set()
+        self.assertEqual(await asyncio.gather(first, second),
+                         ["Error processing request: boom"] * 2)
+
+        claude.error = None
+        claude.release = None
+        self.assertEqual(await agent.invoke("failing question"), "42")
+        self.assertEqual(claude.calls, 2)
+
+    async def test_fallback_answers_are_not_cached(self):
+        """Test chat()'s error and fallback messages are not replayed"""
+        claude = FakeClaude(reply=agent_executor.EMPTY_RESPONSE_MESSAGE)
+        agent = make_agent(claude)
+        await agent.invoke("question")
+        await agent.invoke("question")
+        self.assertEqual(claude.calls, 2)
+
+    async def test_stateful_tool_responses_are_not_cached(self):
+        """Test answers that used the browser, history or code execution are recomputed"""
+        for tool in ("press_cell", "get_recent_client_inputs", "execute_code"):
+            with self.subTest(tool=tool):
+                claude = FakeClaude(tools={tool})
+                agent = make_agent(claude)
+                await agent.invoke("question")
+                await agent.invoke("question")
+                self.assertEqual(claude.calls, 2)
+
+    async def test_pure_tool_responses_are_cached(self):
+        """Test answers from deterministic tools are cached"""
+        claude = FakeClaude(tools={"md5_digest"})
+        agent = make_agent(claude)
+        await agent.invoke("md5 of abc")
+        await agent.invoke("md5 of abc")
+        self.assertEqual(claude.calls, 1)
+
+
+class TestSessionHistory(unittest.TestCase):
+    """Test the executor's per-conversation history"""
+
+    def setUp(self):
+        with patch.object(agent_executor, 'get_anthropic_model', return_value=FakeClaude()):
+            self.executor = AgentBeatsPracticeAgentExecutor()
+
+    def test_history_is_a_copy(self):
+        """Test callers can't modify the stored history"""
+        self.executor._remember_turn("ctx", "hi", "hello")
+        history = self.executor._session_history("ctx")
+        history.append({'role': 'user', 'content': 'extra'})
+        self.assertEqual(len(self.executor._session_history("ctx")), 2)
+
+    def test_least_recently_used_session_is_evicted(self):
+        """Test reading a session's history keeps it from eviction"""
+        self.executor.max_sessions = 2
+        self.executor._remember_turn("a", "1", "one")
+        self.executor._remember_turn("b", "2", "two")
+        self.executor._session_history("a")
+        self.executor._remember_turn("c", "3", "three")
+        self.assertEqual(list(self.executor._sessions), ["a", "c"])
+
+    def test_history_is_trimmed(self):
+        """Test only the most recent messages of a long conversation are kept"""
+        for i in range(agent_executor.MAX_CHANNEL_HISTORY_MESSAGES):
+            self.executor._remember_turn("ctx", f"q{i}", f"a{i}")
+        history = self.executor._session_history("ctx")
+        self.assertEqual(len(history), agent_executor.MAX_CHANNEL_HISTORY_MESSAGES)
+        self.assertEqual(history[-1], {'role': 'assistant', 'content': f"a{i}"})
+
+
+
+class FakeAgent:
+    """Stands in for AgentBeatsPracticeAgent: records the history each turn saw"""
+
+    def __init__(self):
+        self.seen = []
+        self.gates = {}  # user input -> asyncio.Event the turn waits on
+
+    async def invoke(self, user_input, images, history=None):
+        self.seen.append((user_input, [m['content'] for m in history]))
+        gate = self.gates.get(user_input)
+        if gate is not None:
+            await gate.wait()
+        return f"reply to {user_input}"
+
+    @staticmethod
+    def is_real_answer(response):
+        return True
+
+
+def request(text, context_id):
+    """A2A request context carrying one text part"""
+    part = SimpleNamespace(root=SimpleNamespace(text=text))
+    return SimpleNamespace(message=SimpleNamespace(parts=[part]), context_id=context_id)
+
+
+class TestSessionLocks(unittest.IsolatedAsyncioTestCase):
+    """Test turns are serialized per conversation"""
+
+    async def asyncSetUp(self):
+        with patch.object(agent_executor, 'get_anthropic_model', return_value=FakeClaude()):
+            self.executor = AgentBeatsPracticeAgentExecutor()
+        self.executor.agent = FakeAgent()
+        self.executor._store_input_in_background = lambda *args: None
+        self.event_queue = SimpleNamespace(enqueue_event=AsyncMock())
+
+    async def test_same_context_turns_run_in_order(self):
+        """Test a second turn waits for the first and sees it in its history"""
+        agent = self.executor.agent
+        agent.gates["first"] = asyncio.Event()
+        first = asyncio.create_task(self.executor.execute(request("first", "ctx"), self.event_queue))
+        second = asyncio.create_task(self.executor.execute(request("second", "ctx"), self.event_queue))
+        await asyncio.sleep(0.01)
+        self.assertEqual([text for text, _ in agent.seen], ["first"])
+
+        agent.gates["first"].set()
+        await asyncio.gather(first, second)
+        self.assertEqual(agent.seen[1], ("second", ["first", "reply to first"]))
+        self.assertEqual([m['content'] for m in self.executor._session_history("ctx")],
+                         ["first", "reply to first", "second", "reply to second"])
+
+    async def test_other_contexts_are_not_blocked(self):
+        """Test a slow turn in one conversation doesn't hold up another"""
+        agent = self.executor.agent
+        agent.gates["slow"] = asyncio.Event()
+        slow = asyncio.create_task(self.executor.execute(request("slow", "a"), self.event_queue))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(self.executor.execute(request("fast", "b"), self.event_queue), timeout=1)
+        self.assertFalse(slow.done())
+
+        agent.gates["slow"].set()
+        await slow
+
+    async def test_idle_locks_are_released(self):
+        """Test a conversation's lock is dropped once no turn holds it"""
+        await self.executor.execute(request("hello", "ctx"), self.event_queue)
+        gc.collect()
+        self.assertEqual(len(self.executor._session_locks), 0)
+        self.assertEqual(len(self.executor._session_history("ctx")), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,18 +4,28 @@ Test script for Anthropic Claude integration.
 This allows you to directly test the AnthropicModel without going through the full agent pipeline.
 """
 
+import argparse
 import asyncio
 import sys
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Add current directory to path to import our modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from agent_executor import AnthropicModel
+# Importing agent_executor loads the .env next to it (without overriding set variables), so it isn't parsed twice here
+from agent_executor import get_anthropic_model
+
+# Snapshot after agent_executor has loaded .env
+_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
+
+# Test cases
+_DEFAULT_TEST_CASES = (
+    "What is 5 + 3?",
+    "Tom has 23 candies, and Anna gives him 17 more. How many candies does he have in total?",
+    "There are 56 apples in a basket. Children eat 19 of them. How many apples are left?",
+    "What is 15 * 7?",
+    "Hello, how are you?",  # Non-math question to see how it responds
+)
 
 
 async def test_anthropic_direct():
@@ -23,39 +33,36 @@ async def test_anthropic_direct():
     print("=== Testing Anthropic Model Directly ===\n")
     
     try:
-        # Initialize the model
-        claude = AnthropicModel()
+        # Initialize the model (shared across all tests, so the client and its connections are reused)
+        claude = get_anthropic_model()
         print("✅ AnthropicModel initialized successfully")
         print(f"Model: {claude.model}")
-        print(f"API Key present: {'Yes' if os.getenv('ANTHROPIC_API_KEY') else 'No'}")
+        print(f"API Key present: {'Yes' if _API_KEY else 'No'}")
         print()
         
     except Exception as e:
         print(f"❌ Failed to initialize AnthropicModel: {e}")
         return
     
-    # Test cases
-    test_cases = [
-        "What is 5 + 3?",
-        "Tom has 23 candies, and Anna gives him 17 more. How many candies does he have in total?",
-        "There are 56 apples in a basket. Children eat 19 of them. How many apples are left?",
-        "What is 15 * 7?",
-        "Hello, how are you?"  # Non-math question to see how it responds
-    ]
+    test_cases = _DEFAULT_TEST_CASES
     
     print("=== Running Test Cases ===")
-    for i, question in enumerate(test_cases, 1):
+    # The questions are independent, so send them all at once and report in order
+    responses = await asyncio.gather(
+        *(claude.chat([{"role": "user", "content": question}]) for question in test_cases),
+        return_exceptions=True,
+    )
+    for i, (question, response) in enumerate(zip(test_cases, responses), 1):
         print(f"\n--- Test {i} ---")
         print(f"Question: {question}")
         
-        try:
-            response = await claude.chat([{"role": "user", "content": question}])
-            print(f"Raw Response: '{response}'")
-            print(f"Response Type: {type(response)}")
-            print(f"Response Length: {len(response)} characters")
-            
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        if isinstance(response, Exception):
+            print(f"❌ Error: {response}")
+            continue
+        
+        print(f"Raw Response: '{response}'")
+        print(f"Response Type: {type(response)}")
+        print(f"Response Length: {len(response)} characters")
 
 
 async def interactive_test():
@@ -65,7 +72,7 @@ async def interactive_test():
     print("Type 'quit', 'exit', or 'q' to stop.\n")
     
     try:
-        claude = AnthropicModel()
+        claude = get_anthropic_model()
     except Exception as e:
         print(f"❌ Failed to initialize AnthropicModel: {e}")
         return
@@ -97,7 +104,7 @@ async def test_system_prompt():
     print("\n=== Testing System Prompt Effectiveness ===")
     
     try:
-        claude = AnthropicModel()
+        claude = get_anthropic_model()
         
         # Test a math question to see if it follows the "numbers only" instruction
         question = "What is 25 + 17? Please explain your work."
@@ -123,7 +130,7 @@ def check_environment():
     print("=== Environment Check ===")
     
     # Check API key
-    api_key = os.getenv('ANTHROPIC_API_KEY')
+    api_key = _API_KEY
     if api_key:
         print(f"✅ ANTHROPIC_API_KEY is set (length: {len(api_key)} characters)")
     else:
@@ -150,14 +157,29 @@ def check_environment():
     print()
 
 
-async def main():
-    """Main test function"""
+async def main(mode: str = None):
+    """Main test function; runs the given mode directly, or shows the menu if no mode is given"""
     print("Anthropic Claude Integration Test")
     print("=" * 40)
     
     # Check environment first
     check_environment()
     
+    # Non-interactive run (e.g. from CI): python test_anthropic.py --mode all
+    if mode == 'direct':
+        await test_anthropic_direct()
+        return
+    elif mode == 'interactive':
+        await interactive_test()
+        return
+    elif mode == 'system':
+        await test_system_prompt()
+        return
+    elif mode == 'all':
+        await test_anthropic_direct()
+        await test_system_prompt()
+        return
+    
     # Menu
     while True:
         print("\nSelect test mode:")
@@ -185,8 +207,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Anthropic Claude integration tests")
+    parser.add_argument("--mode", choices=["direct", "interactive", "system", "all"],
+                        help="Run one test mode without the interactive menu")
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(args.mode))
     except KeyboardInterrupt:
         print("\nTest interrupted by user.")
     except Exception as e:
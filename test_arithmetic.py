@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test suite for arithmetic.py
+
+This test suite covers:
+- Plain arithmetic requests answered locally
+- Inputs that must fall back to the model
+"""
+
+import unittest
+
+from arithmetic import solve_simple_arithmetic
+
+
+class TestSolveSimpleArithmetic(unittest.TestCase):
+    """Test the local arithmetic fast path"""
+
+    def test_question_forms(self):
+        """Test common question phrasings"""
+        self.assertEqual(solve_simple_arithmetic("What is 5 + 3?"), "8")
+        self.assertEqual(solve_simple_arithmetic("what's 15 * 7"), "105")
+        self.assertEqual(solve_simple_arithmetic("Calculate 100 - 58"), "42")
+        self.assertEqual(solve_simple_arithmetic("  23 + 17  "), "40")
+        self.assertEqual(solve_simple_arithmetic("6 * 7 ="), "42")
+
+    def test_multiplication_and_division_symbols(self):
+        """Test x, × and ÷ are treated as operators"""
+        self.assertEqual(solve_simple_arithmetic("12 x 7"), "84")
+        self.assertEqual(solve_simple_arithmetic("12×7"), "84")
+        self.assertEqual(solve_simple_arithmetic("84 ÷ 7"), "12")
+        self.assertEqual(solve_simple_arithmetic("(2 + 3) X 4"), "20")
+
+    def test_hex_literals_are_not_multiplication(self):
+        """Test a letter x inside a number is left to the model, not read as times"""
+        self.assertIsNone(solve_simple_arithmetic("0x10"))
+        self.assertIsNone(solve_simple_arithmetic("0x10 + 1"))
+        self.assertIsNone(solve_simple_arithmetic("12x7"))
+
+    def test_precedence_parentheses_and_negatives(self):
+        """Test operator precedence, grouping and unary minus"""
+        self.assertEqual(solve_simple_arithmetic("2 + 3 * 4"), "14")
+        self.assertEqual(solve_simple_arithmetic("(2 + 3) * 4"), "20")
+        self.assertEqual(solve_simple_arithmetic("5 - 8"), "-3")
+        self.assertEqual(solve_simple_arithmetic("2 - -3"), "5")
+
+    def test_exact_decimals(self):
+        """Test results are exact rather than binary floating point"""
+        self.assertEqual(solve_simple_arithmetic("0.1 + 0.2"), "0.3")
+        self.assertEqual(solve_simple_arithmetic("5 / 2"), "2.5")
+        self.assertEqual(solve_simple_arithmetic("6 / 3"), "2")
+        self.assertEqual(solve_simple_arithmetic("-1 / 8"), "-0.125")
+        self.assertEqual(solve_simple_arithmetic("3 / 400"), "0.0075")
+
+    def test_large_operands_are_not_rounded(self):
+        """Test results with more than 100 significant digits keep every digit"""
+        operand = '1234567890' * 15 + '1'
+        self.assertEqual(solve_simple_arithmetic('0.5 * ' + operand), f"{int(operand) // 2}.5")
+        # n / 2**10 == n * 5**10 / 10**10
+        scaled = str(int(operand) * 5 ** 10)
+        self.assertEqual(solve_simple_arithmetic(operand + ' / 1024'), f"{scaled[:-10]}.{scaled[-10:].rstrip('0')}")
+
+    def test_falls_back_to_model(self):
+        """Test anything that isn't plain arithmetic returns None"""
+        self.assertIsNone(solve_simple_arithmetic("Tom has 23 candies and gets 17 more"))
+        self.assertIsNone(solve_simple_arithmetic("452"))
+        self.assertIsNone(solve_simple_arithmetic("10 / 3"))
+        self.assertIsNone(solve_simple_arithmetic("1 / 0"))
+        self.assertIsNone(solve_simple_arithmetic("2 ** 10"))
+        self.assertIsNone(solve_simple_arithmetic("5 +"))
+        self.assertIsNone(solve_simple_arithmetic("Generate MD5 hash of 'hello world'"))
+        self.assertIsNone(solve_simple_arithmetic("1 + " * 100 + "1"))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
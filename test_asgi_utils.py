@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test suite for asgi_utils.py
+
+This test suite covers:
+- FastCORSMiddleware preflight handling and header injection
+- StaticJSONApp prebuilt JSON responses
+"""
+
+import asyncio
+import json
+import unittest
+
+from asgi_utils import FastCORSMiddleware, StaticJSONApp
+
+
+def run_asgi(app, scope):
+    """Run an ASGI app against a scope and collect the sent messages"""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+def make_scope(method="GET", path="/", headers=None):
+    return {"type": "http", "method": method, "path": path, "headers": headers or []}
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"hello"})
+
+
+class TestFastCORSMiddleware(unittest.TestCase):
+    """Test the pure-ASGI CORS middleware"""
+
+    def test_no_origin_passes_through_untouched(self):
+        """Test same-origin requests get no CORS headers"""
+        sent = run_asgi(FastCORSMiddleware(ok_app), make_scope())
+        self.assertEqual(sent[0]["headers"], [(b"content-type", b"text/plain")])
+        self.assertEqual(sent[1]["body"], b"hello")
+
+    def test_simple_request_gets_cors_headers(self):
+        """Test cross-origin requests echo the origin and allow credentials"""
+        scope = make_scope(headers=[(b"origin", b"https://example.com")])
+        sent = run_asgi(FastCORSMiddleware(ok_app), scope)
+        headers = dict(sent[0]["headers"])
+        self.assertEqual(headers[b"access-control-allow-origin"], b"https://example.com")
+        self.assertEqual(headers[b"access-control-allow-credentials"], b"true")
+        self.assertEqual(headers[b"content-type"], b"text/plain")
+        self.assertEqual(sent[1]["body"], b"hello")
+
+    def test_preflight_answered_without_calling_app(self):
+        """Test OPTIONS preflight is answered directly by the middleware"""
+        async def failing_app(scope, receive, send):
+            raise AssertionError("app should not be called for preflight")
+
+        scope = make_scope("OPTIONS", headers=[
+            (b"origin", b"https://example.com"),
+            (b"access-control-request-method", b"POST"),
+            (b"access-control-request-headers", b"content-type"),
+        ])
+        sent = run_asgi(FastCORSMiddleware(failing_app), scope)
+        self.assertEqual(sent[0]["status"], 200)
+        headers = dict(sent[0]["headers"])
+        self.assertIn(b"POST", headers[b"access-control-allow-methods"])
+        self.assertEqual(headers[b"access-control-allow-headers"], b"content-type")
+        self.assertEqual(sent[1]["body"], b"OK")
+
+    def test_plain_options_reaches_app(self):
+        """Test OPTIONS without a preflight method header is forwarded"""
+        scope = make_scope("OPTIONS", headers=[(b"origin", b"https://example.com")])
+        sent = run_asgi(FastCORSMiddleware(ok_app), scope)
+        self.assertEqual(sent[1]["body"], b"hello")
+
+
+class TestStaticJSONApp(unittest.TestCase):
+    """Test the prebuilt static JSON ASGI app"""
+
+    def test_serves_serialized_payload(self):
+        """Test the payload is sent as JSON with a matching content-length"""
+        payload = {"status": "online", "endpoints": {"a2a_rpc": "/a2a"}}
+        sent = run_asgi(StaticJSONApp(payload), make_scope())
+        headers = dict(sent[0]["headers"])
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(headers[b"content-type"], b"application/json")
+        self.assertEqual(int(headers[b"content-length"]), len(sent[1]["body"]))
+        self.assertEqual(json.loads(sent[1]["body"]), payload)
+
+    def test_accepts_preserialized_bytes(self):
+        """Test bytes payloads are served as-is"""
+        sent = run_asgi(StaticJSONApp(b'{"a":1}'), make_scope())
+        self.assertEqual(sent[1]["body"], b'{"a":1}')
+
+    def test_cors_does_not_leak_headers_between_requests(self):
+        """Test CORS header injection doesn't mutate the shared header list"""
+        static_app = StaticJSONApp({"a": 1})
+        app = FastCORSMiddleware(static_app)
+        scope = make_scope(headers=[(b"origin", b"https://example.com")])
+        run_asgi(app, scope)
+        sent = run_asgi(app, scope)
+        self.assertEqual(len(static_app.headers), 2)
+        self.assertEqual(len(sent[0]["headers"]), 5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
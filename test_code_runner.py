@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test suite for code_runner.py
+
+This test suite covers:
+- Snippet output, errors and exit codes
+- Timeouts and crashing snippets
+"""
+
+import unittest
+
+from code_runner import run_code
+
+
+class TestRunCode(unittest.TestCase):
+    """Test executing snippets in their own interpreter"""
+
+    def test_output_and_errors(self):
+        """Test the tool's result messages"""
+        self.assertEqual(run_code("print('hello')"), "hello")
+        self.assertEqual(run_code("x = 1"), "Code executed successfully (no output)")
+        result = run_code("raise ValueError('boom')")
+        self.assertTrue(result.startswith("Error: Traceback"))
+        self.assertIn("ValueError: boom", result)
+
+    def test_runs_as_main(self):
+        """Test snippets see __name__ == '__main__' like a script"""
+        self.assertEqual(run_code("if __name__ == '__main__':\n    print('main')"), "main")
+
+    def test_exit_codes(self):
+        """Test sys.exit follows interpreter exit-code semantics"""
+        self.assertEqual(run_code("import sys; sys.exit(0)"), "Code executed successfully (no output)")
+        self.assertEqual(run_code("import sys; sys.exit('bad input')"), "Error: bad input")
+
+    def test_hard_exit_reports_error_immediately(self):
+        """Test a snippet killing its interpreter is reported as a failure, not a timeout"""
+        result = run_code("import os, sys; sys.stderr.write('dying'); sys.stderr.flush(); os._exit(3)", timeout=5)
+        self.assertEqual(result, "Error: dying")
+
+    def test_captures_output_below_python(self):
+        """Test output written straight to the file descriptor is captured"""
+        self.assertEqual(run_code("import os; os.write(1, b'raw output')"), "raw output")
+
+    def test_timeout(self):
+        """Test a stuck snippet is killed and later snippets still run"""
+        self.assertEqual(run_code("while True: pass", timeout=0.5),
+                         "Error: Code execution timed out (0.5 seconds limit)")
+        self.assertEqual(run_code("print('still working')"), "still working")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test suite for image_utils.py
+
+This test suite covers:
+- Oversized images being shrunk to Claude's image budget
+- Small or undecodable images passing through unchanged
+"""
+
+import base64
+import io
+import unittest
+
+import image_utils
+from image_utils import prepare_image, _target_size
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def make_image_bytes(size, mode='RGB', fmt='PNG'):
+    """Create an in-memory image of the given size"""
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+class TestTargetSize(unittest.TestCase):
+    """Test the resize budget calculation"""
+
+    def test_small_image_unchanged(self):
+        """Test images within budget keep their size"""
+        self.assertEqual(_target_size(800, 600), (800, 600))
+
+    def test_long_edge_capped(self):
+        """Test the long edge is capped at 1568px"""
+        width, height = _target_size(4000, 500)
+        self.assertLessEqual(width, image_utils.MAX_LONG_EDGE)
+        self.assertAlmostEqual(width / height, 8, delta=0.1)
+
+    def test_area_capped(self):
+        """Test the pixel count is capped at ~1.15MP"""
+        width, height = _target_size(1500, 1500)
+        self.assertLessEqual(width * height, image_utils.MAX_PIXELS)
+
+
+class TestPrepareImage(unittest.TestCase):
+    """Test image preprocessing before it is sent to Claude"""
+
+    def test_undecodable_base64_passed_through(self):
+        """Test invalid base64 strings are returned as-is"""
+        self.assertEqual(prepare_image("not base64!", "image/png"), ("not base64!", "image/png"))
+
+    @unittest.skipIf(Image is None, "Pillow not installed")
+    def test_small_image_passed_through(self):
+        """Test images within budget are not re-encoded"""
+        raw = make_image_bytes((200, 100))
+        encoded = base64.b64encode(raw).decode('utf-8')
+        self.assertEqual(prepare_image(raw, "image/png"), (encoded, "image/png"))
+        self.assertEqual(prepare_image(encoded, "image/png"), (encoded, "image/png"))
+
+    @unittest.skipIf(Image is None, "Pillow not installed")
+    def test_large_image_downscaled_to_jpeg(self):
+        """Test oversized opaque images are resized and re-encoded as JPEG"""
+        data, media_type = prepare_image(make_image_bytes((3000, 2000)), "image/png")
+        self.assertEqual(media_type, "image/jpeg")
+        with Image.open(io.BytesIO(base64.b64decode(data))) as img:
+            self.assertLessEqual(max(img.size), image_utils.MAX_LONG_EDGE)
+            self.assertLessEqual(img.size[0] * img.size[1], image_utils.MAX_PIXELS)
+
+    @unittest.skipIf(Image is None, "Pillow not installed")
+    def test_large_transparent_image_stays_png(self):
+        """Test images with transparency keep PNG so alpha isn't lost"""
+        data, media_type = prepare_image(make_image_bytes((3000, 2000), mode='RGBA'), "image/png")
+        self.assertEqual(media_type, "image/png")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,9 +1,160 @@
 from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+import atexit
 import re
+import threading
+import weakref
+
+# Winning number patterns: "...secret: 20250902093507", or any 13+ digit number on the page
+_SECRET_RE = re.compile(r'secret:\s*(\d+)')
+_LONG_NUMBER_RE = re.compile(r'\b\d{13,}\b')
+
+# Page messages announcing the result, matched case-insensitively without lowercasing the text
+_WIN_TEXT_RE = re.compile(r'you won|you win', re.IGNORECASE)
+_LOSE_TEXT_RE = re.compile(r'you lost|you lose|computer wins', re.IGNORECASE)
+
+# Canonical player marks, so has_winning_combination doesn't allocate a lowercased copy per call
+_PLAYER_MARKS = {'x': 'x', 'X': 'x', 'o': 'o', 'O': 'o'}
+
+# Runs in the browser: returns the 9 cell texts (by data-index) plus the visible text of the
+# congratulations and gameStatus divs, so a board read costs one WebDriver round-trip
+_READ_GAME_STATE_JS = """
+const cells = ['', '', '', '', '', '', '', '', ''];
+document.querySelectorAll('button[data-index]').forEach(function (button) {
+    const i = parseInt(button.getAttribute('data-index'), 10);
+    if (i >= 0 && i < 9) {
+        cells[i] = button.innerText.trim().toLowerCase();
+    }
+});
+function visibleText(id) {
+    const el = document.getElementById(id);
+    if (!el || el.getClientRects().length === 0 || getComputedStyle(el).visibility === 'hidden') {
+        return null;
+    }
+    return el.innerText;
+}
+return {cells: cells, congratulations: visibleText('congratulations'), gameStatus: visibleText('gameStatus')};
+"""
+
+# The one shared browser, used by the agent's tools and by calls that don't pass a driver:
+# Chrome startup costs seconds, the DOM work milliseconds
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+
+
+def _chrome_options():
+    """
+    Build the Chrome options for the shared game browser.
+    
+    Returns:
+        Options: Chrome options (Pacific timezone, caching and image loading disabled)
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    
+    # CRITICAL: Force Pacific timezone for tic-tac-toe validation
+    chrome_options.add_argument("--timezone=America/Los_Angeles")
+    
+    # Disable cache to prevent stale winning numbers
+    chrome_options.add_argument("--disable-application-cache")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    
+    # The game is plain buttons and text, so skip downloading images
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    
+    # Add headless mode for faster performance (comment out to see browser)
+    # chrome_options.add_argument("--headless")  # COMMENTED OUT - browser will be visible!
+    return chrome_options
+
+
+def get_driver():
+    """
+    Return the shared module-level Chrome driver, starting it on first use.
+    
+    Returns:
+        WebDriver: The cached driver, quit by close_driver or automatically at interpreter exit
+    """
+    global _DRIVER
+    with _DRIVER_LOCK:
+        if _DRIVER is None:
+            _DRIVER = webdriver.Chrome(options=_chrome_options())
+            _DRIVER.set_page_load_timeout(15)  # 15 second timeout
+            _DRIVER.implicitly_wait(15)  # 15 second implicit wait
+            print("🌐 Created new Chrome driver for tic-tac-toe (PST timezone, cache disabled)")
+        return _DRIVER
+
+
+def close_driver():
+    """
+    Quit the shared module-level Chrome driver, if one was started.
+    
+    The next call without a driver starts a fresh browser.
+    """
+    global _DRIVER
+    with _DRIVER_LOCK:
+        driver, _DRIVER = _DRIVER, None
+    if driver is not None:
+        try:
+            driver.quit()
+            print("🔒 Closed tic-tac-toe Chrome driver")
+        except Exception as e:
+            print(f"Error closing driver: {e}")
+
+
+atexit.register(close_driver)
+
+# Drivers whose page has already shown the game board; cleared whenever the page is (re)loaded,
+# so polling calls on a loaded game skip the presence wait and its WebDriver round-trip
+_BOARD_READY = weakref.WeakSet()
+_BOARD_PRESENT = EC.presence_of_element_located((By.ID, "gameBoard"))
+_BODY_PRESENT = EC.presence_of_element_located((By.TAG_NAME, "body"))
+
+
+def _open_game(driver, url):
+    """
+    Navigate the driver to the game if it isn't already there.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        url: URL of the tic-tac-toe game
+    """
+    if driver.current_url != url:
+        driver.get(url)
+        _BOARD_READY.discard(driver)
+
+
+def _ensure_board(driver):
+    """
+    Wait for the game board to load, unless it was already seen on the current page.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    """
+    if driver in _BOARD_READY:
+        return
+    WebDriverWait(driver, 15).until(_BOARD_PRESENT)
+    _BOARD_READY.add(driver)
+
+
+def mark_board_stale(driver):
+    """
+    Forget that the game board was loaded, e.g. after refreshing or navigating the page directly.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    """
+    _BOARD_READY.discard(driver)
+
 
 def press_cell(num: int, driver=None, url="https://ttt.puppy9.com/"):
     """
@@ -14,7 +165,7 @@ def press_cell(num: int, driver=None, url="https://ttt.puppy9.com/"):
              0 1 2
              3 4 5  
              6 7 8
-        driver: Selenium WebDriver instance (optional, will create one if not provided)
+        driver: Selenium WebDriver instance (optional, uses the shared module driver if not provided)
         url: URL of the tic-tac-toe game
     
     Returns:
@@ -25,21 +176,14 @@ def press_cell(num: int, driver=None, url="https://ttt.puppy9.com/"):
     if not isinstance(num, int) or num < 0 or num > 8:
         raise ValueError("num must be an integer between 0 and 8")
     
-    # Create driver if not provided
-    created_driver = False
+    # Reuse the shared driver if none was provided
     if driver is None:
-        driver = webdriver.Chrome()
-        created_driver = True
+        driver = get_driver()
     
     try:
-        # Navigate to the game if needed
-        if driver.current_url != url:
-            driver.get(url)
-        
-        # Wait for game board to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.ID, "gameBoard"))
-        )
+        # Navigate to the game if needed and wait for the board to load
+        _open_game(driver, url)
+        _ensure_board(driver)
         
         # Find the cell with the specified data-index
         cell_selector = f'button[data-index="{num}"]'
@@ -69,11 +213,6 @@ def press_cell(num: int, driver=None, url="https://ttt.puppy9.com/"):
     except Exception as e:
         print(f"Error pressing cell {num}: {e}")
         return False
-    
-    finally:
-        # Close driver if we created it
-        if created_driver:
-            driver.quit()
 
 
 
@@ -82,116 +221,151 @@ def getCurrGameStatus(driver=None, url="https://ttt.puppy9.com/"):
     Extracts the current tic-tac-toe game state from the webpage.
     
     Args:
-        driver: Selenium WebDriver instance (optional, will create one if not provided)
+        driver: Selenium WebDriver instance (optional, uses the shared module driver if not provided)
         url: URL of the tic-tac-toe game
     
     Returns:
-        dict: {'currentGameBoard': 2D array, 'gameStatus': 'win'|'lose'|'still playing'}
+        dict: {'currentGameBoard': tuple of 9 cells in row-major order ('x', 'o', or ''),
+               'gameStatus': 'win'|'lose'|'still playing'}
+               Use as_2d() to get the board as a 3x3 list of rows.
     """
     
-    # Create driver if not provided
-    created_driver = False
+    # Reuse the shared driver if none was provided
     if driver is None:
-        driver = webdriver.Chrome()  # You may need to specify path to chromedriver
-        created_driver = True
+        driver = get_driver()
     
-    try:
-        # Navigate to the game if needed
-        if driver.current_url != url:
-            driver.get(url)
-        
-        # Wait for game board to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.ID, "gameBoard"))
-        )
-        
-        # Initialize 3x3 game board
-        game_board = [['', '', ''], ['', '', ''], ['', '', '']]
-        
-        # Extract board state from cells
-        for i in range(9):
-            try:
-                # Find cell by data-index attribute
-                cell = driver.find_element(By.CSS_SELECTOR, f'button[data-index="{i}"]')
-                cell_text = cell.text.strip().lower()
-                
-                # Convert 1D index to 2D coordinates
-                row = i // 3
-                col = i % 3
-                
-                # Set cell value ('x', 'o', or empty string)
-                if cell_text in ['x', 'o']:
-                    game_board[row][col] = cell_text
-                else:
-                    game_board[row][col] = ''
-                    
-            except NoSuchElementException:
-                # Cell might not exist or be accessible
-                row = i // 3
-                col = i % 3
-                game_board[row][col] = ''
-        
-        # Determine game status
-        game_status = determine_game_status(driver, game_board)
-        
-        return {
-            'currentGameBoard': game_board,
-            'gameStatus': game_status
-        }
-    
-    finally:
-        # Close driver if we created it
-        if created_driver:
-            driver.quit()
+    # Navigate to the game if needed and wait for the board to load
+    _open_game(driver, url)
+    _ensure_board(driver)
+    
+    # Read the cells and both status messages in a single WebDriver round-trip
+    page = driver.execute_script(_READ_GAME_STATE_JS)
+    
+    # Build the flat board ('x', 'o', or empty string); missing cells stay empty
+    game_board = tuple(cell if cell in ('x', 'o') else '' for cell in page['cells'])
+    
+    # Determine game status
+    game_status = _status_from_page_text(page['congratulations'], page['gameStatus'], _cells_status(game_board))
+    
+    return {
+        'currentGameBoard': game_board,
+        'gameStatus': game_status
+    }
 
 def determine_game_status(driver, board):
     """
-    Determines the current game status based on DOM elements and board state.
+    Determines the current game status based on board state and DOM elements.
     
     Args:
         driver: Selenium WebDriver instance
-        board: 2D array representing current board state
+        board: 2D array representing current board state, or a flat sequence of 9 cells
+               in row-major order (e.g. getCurrGameStatus()['currentGameBoard'])
     
     Returns:
         str: 'win', 'lose', or 'still playing'
     """
     
-    # Check for win message in congratulations div
-    try:
-        congratulations = driver.find_element(By.ID, "congratulations")
-        if congratulations.is_displayed():
-            congrats_text = congratulations.text.lower()
-            if "you won" in congrats_text or "you win" in congrats_text:
-                return 'win'
-    except NoSuchElementException:
-        pass
+    # A decided board needs no DOM round-trips; only an undecided one (ongoing or tied)
+    # is checked against the page's result messages
+    board_status = _board_status(board)
+    if board_status != 'still playing':
+        return board_status
+    
+    # Check for win message in congratulations div (find_elements returns [] instead of raising)
+    congrats_text = None
+    congratulations = driver.find_elements(By.ID, "congratulations")
+    if congratulations and congratulations[0].is_displayed():
+        congrats_text = congratulations[0].text
     
     # Check game status div
-    try:
-        game_status_elem = driver.find_element(By.ID, "gameStatus")
-        status_text = game_status_elem.text.lower()
-        
-        if "you won" in status_text or "you win" in status_text:
+    status_text = None
+    game_status = driver.find_elements(By.ID, "gameStatus")
+    if game_status:
+        status_text = game_status[0].text
+    
+    return _status_from_page_text(congrats_text, status_text, board_status)
+
+
+def _status_from_page_text(congrats_text, status_text, board_status):
+    """
+    Decide the game status from the board, falling back to the page's messages.
+    
+    Args:
+        congrats_text: Text of the visible congratulations div, or None
+        status_text: Text of the gameStatus div, or None
+        board_status: Status decided from the board alone ('win', 'lose', or 'still playing')
+    
+    Returns:
+        str: 'win', 'lose', or 'still playing'
+    """
+    if board_status != 'still playing':
+        return board_status
+    return _status_from_messages(congrats_text, status_text) or board_status
+
+
+def _status_from_messages(congrats_text, status_text):
+    """
+    Read the game result announced by the page, if any.
+    
+    Args:
+        congrats_text: Text of the visible congratulations div, or None
+        status_text: Text of the gameStatus div, or None
+    
+    Returns:
+        str: 'win' or 'lose', or None if the page announces no result
+    """
+    if congrats_text and _WIN_TEXT_RE.search(congrats_text):
+        return 'win'
+    
+    if status_text:
+        if _WIN_TEXT_RE.search(status_text):
             return 'win'
-        elif "you lost" in status_text or "you lose" in status_text or "computer wins" in status_text:
+        elif _LOSE_TEXT_RE.search(status_text):
             return 'lose'
-    except NoSuchElementException:
-        pass
     
-    # Check for win/lose conditions based on board state
-    # Check for winning combinations first (games can end before board is full)
-    if has_winning_combination(board, 'x'):  # Player (X) wins
-        return 'win'
-    elif has_winning_combination(board, 'o'):  # Computer (O) wins
-        return 'lose'
+    return None
+
+
+def _board_status(board):
+    """
+    Decide the game status from the board alone.
+    
+    X winning is checked first; games can end before the board is full, and a full
+    board without a winner still counts as 'still playing'.
+    
+    Args:
+        board: 2D array representing current board state, or a flat sequence of 9 cells
+    
+    Returns:
+        str: 'win', 'lose', or 'still playing'
+    """
+    return _OUTCOMES[_OUTCOME_BY_BOARD[(_encode(board, 'x') << 9) | _encode(board, 'o')]]
+
+
+def _cells_status(cells):
+    """
+    Decide the game status from a flat board alone, like _board_status.
+    
+    Args:
+        cells: Sequence of 9 cells in row-major order
+    
+    Returns:
+        str: 'win', 'lose', or 'still playing'
+    """
+    return _OUTCOMES[_OUTCOME_BY_BOARD[(_encode_cells(cells, 'x') << 9) | _encode_cells(cells, 'o')]]
+
+
+def as_2d(cells):
+    """
+    Reshape a flat board into rows.
     
-    # If no winning combination, check if board is full (tie) or game is still ongoing
-    if is_board_full(board):
-        # This would be a tie, but since we only have 3 options,
-        # we'll call it 'still playing' or you might want to add 'tie'
-        return 'still playing'
+    Args:
+        cells: Sequence of 9 cells in row-major order, e.g. getCurrGameStatus()['currentGameBoard']
     
-    return 'still playing'
+    Returns:
+        list: 3x3 list of rows
+    """
+    return [list(cells[row * 3:row * 3 + 3]) for row in range(3)]
 
 
 def getWinningNumber(driver=None, url="https://ttt.puppy9.com/"):
@@ -199,89 +373,157 @@ def getWinningNumber(driver=None, url="https://ttt.puppy9.com/"):
     Extracts the winning number from the tic-tac-toe game when you win.
     
     Args:
-        driver: Selenium WebDriver instance (optional, will create one if not provided)
+        driver: Selenium WebDriver instance (optional, uses the shared module driver if not provided)
         url: URL of the tic-tac-toe game
     
     Returns:
         str: The winning number (e.g., "20250902093507") or None if not found
     """
     
-    # Create driver if not provided
-    created_driver = False
+    # Reuse the shared driver if none was provided
     if driver is None:
-        driver = webdriver.Chrome()
-        created_driver = True
+        driver = get_driver()
     
-    try:
-        # Navigate to the game if needed
-        if driver.current_url != url:
-            driver.get(url)
-        
-        # Wait for the page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Try to find the congratulations element with the winning number
-        try:
-            # Look for the congratulations div
-            congratulations = driver.find_element(By.ID, "congratulations")
-            if congratulations.is_displayed():
-                congrats_text = congratulations.text
-                
-                # Extract number from text like "You win! Here's your secret: 20250902093507"
-                number_match = re.search(r'secret:\s*(\d+)', congrats_text)
-                if number_match:
-                    return number_match.group(1)
-        except NoSuchElementException:
-            pass
-        
-        # Alternative: look for any element containing the winning pattern
-        try:
-            # Search for any element containing the secret number pattern
-            elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'secret:')]")
-            for element in elements:
-                if element.is_displayed():
-                    text = element.text
-                    number_match = re.search(r'secret:\s*(\d+)', text)
-                    if number_match:
-                        return number_match.group(1)
-        except NoSuchElementException:
-            pass
-        
-        # Another approach: look for long numbers in the page
-        try:
-            # Find elements with long numeric strings (13+ digits)
-            page_text = driver.find_element(By.TAG_NAME, "body").text
-            long_numbers = re.findall(r'\b\d{13,}\b', page_text)
-            if long_numbers:
-                # Return the first long number found (likely the winning number)
-                return long_numbers[0]
-        except NoSuchElementException:
-            pass
+    # Navigate to the game if needed
+    _open_game(driver, url)
+    
+    # Wait for the page to load (already true if the board was seen on this page)
+    if driver not in _BOARD_READY:
+        WebDriverWait(driver, 15).until(_BODY_PRESENT)
+    
+    # Try to find the congratulations element with the winning number
+    # (find_elements returns [] for missing elements, so no exception handling is needed)
+    congratulations = driver.find_elements(By.ID, "congratulations")
+    if congratulations and congratulations[0].is_displayed():
+        congrats_text = congratulations[0].text
         
-        return None
+        # Extract number from text like "You win! Here's your secret: 20250902093507"
+        number_match = _SECRET_RE.search(congrats_text)
+        if number_match:
+            return number_match.group(1)
+    
+    # Alternative: look for any element containing the winning pattern
+    elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'secret:')]")
+    for element in elements:
+        if element.is_displayed():
+            text = element.text
+            number_match = _SECRET_RE.search(text)
+            if number_match:
+                return number_match.group(1)
+    
+    # Another approach: look for long numbers in the page
+    body = driver.find_elements(By.TAG_NAME, "body")
+    if body:
+        # Find long numeric strings (13+ digits)
+        long_numbers = _LONG_NUMBER_RE.findall(body[0].text)
+        if long_numbers:
+            # Return the first long number found (likely the winning number)
+            return long_numbers[0]
+    
+    return None
+
+# Winning lines as 9-bit masks over cell indices 0-8 (bit i = cell i): rows, columns, diagonals
+_WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+
+# Whether each of the 512 possible bitboards contains a winning line, computed once at import
+_HAS_WIN = tuple(any((bits & mask) == mask for mask in _WIN_MASKS) for bits in range(512))
+
+# For each of a player's 512 possible bitboards, the cells that would complete a line they already
+# hold two cells of; masked with the empty cells this gives the open winning (or blocking) squares
+def _completing_cells(bits):
+    completing = 0
+    for mask in _WIN_MASKS:
+        if bin(bits & mask).count('1') == 2:
+            completing |= mask & ~bits
+    return completing
+
+_COMPLETIONS = tuple(_completing_cells(bits) for bits in range(512))
+
+# Cell positions set in each 9-bit mask, ascending
+_POSITIONS = tuple(tuple(i for i in range(9) if bits >> i & 1) for bits in range(512))
+
+# Board-only outcome for every (x_bits, o_bits) pair, indexed by (x_bits << 9) | o_bits:
+# 0 = still playing, 1 = X wins, 2 = O wins. Built a 512-entry row at a time (256 KB)
+_OUTCOMES = ('still playing', 'win', 'lose')
+_X_WINS_ROW = b'\x01' * 512
+_O_OUTCOME_ROW = bytes(2 if has_win else 0 for has_win in _HAS_WIN)
+_OUTCOME_BY_BOARD = bytearray(1 << 18)
+for _x_bits in range(512):
+    _OUTCOME_BY_BOARD[_x_bits << 9:(_x_bits + 1) << 9] = _X_WINS_ROW if _HAS_WIN[_x_bits] else _O_OUTCOME_ROW
+del _x_bits
+
+
+def _encode(board, value):
+    """
+    Encode the cells of the board that hold value as a 9-bit integer.
     
-    finally:
-        # Close driver if we created it
-        if created_driver:
-            driver.quit()
+    Args:
+        board: 2D array representing the game board, or a flat sequence of 9 cells
+               in row-major order
+        value: Cell value to look for ('x', 'o', or '' for empty cells)
+    
+    Returns:
+        int: Bitboard with bit row*3+col set where board[row][col] == value
+    """
+    if len(board) == 9:
+        return _encode_cells(board, value)
+    bits = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == value:
+                bits |= bit
+            bit <<= 1
+    return bits
+
+
+def _encode_cells(cells, value):
+    """
+    Encode the cells of a flat board that hold value as a 9-bit integer.
+    
+    Args:
+        cells: Sequence of 9 cells in row-major order
+        value: Cell value to look for ('x', 'o', or '' for empty cells)
+    
+    Returns:
+        int: Bitboard with bit i set where cells[i] == value
+    """
+    bits = 0
+    bit = 1
+    for cell in cells:
+        if cell == value:
+            bits |= bit
+        bit <<= 1
+    return bits
+
+
+def analyze_board(cells):
+    """
+    Find the open cells that complete a line for X (win opportunities) or for O (threats to block).
+    
+    Args:
+        cells: Sequence of 9 cells in row-major order ('x', 'o', or ''),
+               e.g. getCurrGameStatus()['currentGameBoard']
+    
+    Returns:
+        tuple: (opportunities, threats) as ascending lists of cell positions
+    """
+    empty = _encode_cells(cells, '')
+    return (list(_POSITIONS[_COMPLETIONS[_encode_cells(cells, 'x')] & empty]),
+            list(_POSITIONS[_COMPLETIONS[_encode_cells(cells, 'o')] & empty]))
+
 
 def is_board_full(board):
     """
     Check if the board is completely filled.
     
     Args:
-        board: 2D array representing the game board
+        board: 2D array representing the game board, or a flat sequence of 9 cells
     
     Returns:
         bool: True if board is full
     """
-    for row in board:
-        for cell in row:
-            if cell == '':
-                return False
-    return True
+    return _encode(board, '') == 0
 
 
 def has_winning_combination(board, player):
@@ -289,28 +531,10 @@ def has_winning_combination(board, player):
     Check if a player has a winning combination on the board.
     
     Args:
-        board: 2D array representing the game board
+        board: 2D array representing the game board, or a flat sequence of 9 cells
         player: 'x' or 'o'
     
     Returns:
         bool: True if player has winning combination
     """
-    player = player.lower()
-    
-    # Check rows
-    for row in board:
-        if all(cell == player for cell in row):
-            return True
-    
-    # Check columns
-    for col in range(3):
-        if all(board[row][col] == player for row in range(3)):
-            return True
-    
-    # Check diagonals
-    if all(board[i][i] == player for i in range(3)):
-        return True
-    if all(board[i][2-i] == player for i in range(3)):
-        return True
-    
-    return False
\ No newline at end of file
+    return _HAS_WIN[_encode(board, _PLAYER_MARKS.get(player) or player.lower())]
@@ -2,136 +2,131 @@ import hashlib
 import base64
 import sqlite3
 import os
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Optional, Union
 
-# Import tic-tac-toe functions
-from tictactoe_tool import press_cell, getCurrGameStatus, getWinningNumber
+# pybase64 is a drop-in, SIMD-accelerated base64 codec; fall back to the stdlib where unavailable
+try:
+    import pybase64 as b64codec
+except ImportError:
+    b64codec = base64
 
-# Selenium driver for persistent tic-tac-toe sessions
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+# Runs each snippet in its own interpreter
+from code_runner import run_code
+
+# Import tic-tac-toe functions; the shared Chrome driver is started and quit only in tictactoe_tool
+from tictactoe_tool import (press_cell, getCurrGameStatus, getWinningNumber, mark_board_stale, as_2d, analyze_board,
+                            get_driver, close_driver)
 
 class TicTacToeDriverManager:
-    """Manages a persistent Chrome driver for tic-tac-toe games"""
+    """Serializes access to the shared tic-tac-toe browser"""
     
     def __init__(self):
-        self.driver = None
         self.game_url = "https://ttt.puppy9.com/"
-    
-    def get_driver(self):
-        """Get or create the persistent driver"""
-        if self.driver is None:
-            chrome_options = Options()
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            
-            # CRITICAL: Force Pacific timezone for tic-tac-toe validation
-            chrome_options.add_argument("--timezone=America/Los_Angeles")
-            
-            # Disable cache to prevent stale winning numbers
-            chrome_options.add_argument("--disable-application-cache")
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            
-            # Add headless mode for faster performance (comment out to see browser)
-            # chrome_options.add_argument("--headless")  # COMMENTED OUT - browser will be visible!
-            
-            # Set page load timeout
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(15)  # 15 second timeout
-            self.driver.implicitly_wait(15)  # 15 second implicit wait
-            print("🌐 Created new Chrome driver for tic-tac-toe (PST timezone, cache disabled)")
-        
-        return self.driver
-    
-    def close_driver(self):
-        """Close the persistent driver"""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
-            print("🔒 Closed tic-tac-toe Chrome driver")
+        # Serializes browser tool calls coming from concurrent requests
+        self.lock = threading.Lock()
 
 # Global driver manager instance
 ttt_driver_manager = TicTacToeDriverManager()
 
+# Digest constructors bound once; these hashes are checksums, not security primitives, so
+# usedforsecurity=False keeps them available (and on OpenSSL's fast path) on FIPS-mode hosts
+_md5 = hashlib.md5
+_sha512 = hashlib.sha512
+
+def _as_bytes(data: Union[str, bytes, bytearray, memoryview]):
+    """UTF-8 encode text; binary data is used as-is without a copy"""
+    return data.encode('utf-8') if isinstance(data, str) else data
+
 # Tool definitions for the agent
-def md5_digest(data: str) -> str:
-    """Generate MD5 hash of the input data (as hex string)"""
-    return hashlib.md5(data.encode('utf-8')).hexdigest()
+def md5_digest(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """Generate MD5 hash of the input data (as hex string); text is hashed as UTF-8"""
+    return _md5(_as_bytes(data), usedforsecurity=False).hexdigest()
 
-def sha512_digest(data: str) -> str:
-    """Generate SHA512 hash of the input data (as hex string)"""
-    return hashlib.sha512(data.encode('utf-8')).hexdigest()
+def sha512_digest(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """Generate SHA512 hash of the input data (as hex string); text is hashed as UTF-8"""
+    return _sha512(_as_bytes(data), usedforsecurity=False).hexdigest()
 
-def base64_encode(data: str) -> str:
-    """Encode data to base64"""
-    return base64.b64encode(data.encode('utf-8')).decode('utf-8')
+def base64_encode(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """Encode data to base64; text is encoded as UTF-8"""
+    return b64codec.b64encode(_as_bytes(data)).decode('ascii')
 
 def base64_decode(data: str) -> str:
     """Decode base64 data"""
     try:
-        return base64.b64decode(data).decode('utf-8')
+        return b64codec.b64decode(data).decode('utf-8')
     except Exception as e:
         return f"Error decoding base64: {str(e)}"
     
 def execute_code(code: str) -> str:
-    """Execute Python code safely and return the result"""
-    try:
-        import subprocess
-        import tempfile
-        import os
-        
-        # Create a temporary file to write the code
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_file = f.name
-        
-        try:
-            # Execute the code with timeout protection
-            result = subprocess.run(
-                ['python3', temp_file], 
-                capture_output=True, 
-                text=True, 
-                timeout=30  # 30 second timeout
-            )
-            
-            # Clean up temp file
-            os.unlink(temp_file)
-            
-            if result.returncode == 0:
-                return result.stdout.strip() if result.stdout else "Code executed successfully (no output)"
-            else:
-                return f"Error: {result.stderr.strip()}"
-                
-        except subprocess.TimeoutExpired:
-            os.unlink(temp_file)
-            return "Error: Code execution timed out (30 seconds limit)"
-        except Exception as e:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-            return f"Error executing code: {str(e)}"
-            
-    except Exception as e:
-        return f"Error setting up code execution: {str(e)}"
+    """Execute Python code in a fresh interpreter and return the result"""
+    return run_code(code)
+
+
+# Statement texts shared by every call, so each connection's prepared-statement cache
+# (sqlite3 keeps the last 128 per connection) compiles each one once
+_SQL_INSERT_INPUT = '''
+    INSERT INTO client_inputs (input_text, session_id, user_id) 
+    VALUES (?, ?, ?)
+'''
+
+_SQL_RECENT_INPUTS = '''
+    SELECT id, input_text AS input, timestamp, session_id,
+           strftime('%m/%d %H:%M', timestamp) AS time,  -- Compact "MM/DD HH:MM", formatted by SQLite
+           (SELECT COALESCE(MAX(cnt), 0) FROM user_stats WHERE user_id = ?1) AS total  -- All of the user's inputs
+    FROM client_inputs 
+    WHERE user_id = ?1 
+    ORDER BY id DESC 
+    LIMIT ?2
+'''
+
+_SQL_COUNT_INPUTS = '''
+    SELECT cnt FROM user_stats WHERE user_id = ?
+'''
 
 
 class InputHistoryDB:
     """SQLite3 database for storing client input history"""
     
-    def __init__(self, db_path: str = "./client_history.db"):
+    OPTIMIZE_EVERY = 1000
+    
+    def __init__(self, db_path: str = "./client_history.db", use_wal: bool = True):
         self.db_path = db_path
+        self.use_wal = use_wal  # Disable when the database lives on a network filesystem (NFS)
+        self._local = threading.local()  # One open connection per thread, reused across operations
+        self._inserts_since_optimize = 0
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with per-connection performance settings applied"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row  # Name-addressable rows without building a dict per row
+        if self.use_wal:
+            # With WAL, NORMAL sync is still safe against corruption and avoids an fsync per commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Memory-map reads (WAL already requires a local filesystem)
+            conn.execute("PRAGMA mmap_size=268435456")
+        # Keep temporary sort/index structures in memory and allow a 64 MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+    
     def _init_database(self):
         """Initialize the SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
+        # Write-ahead logging lets readers and the writer proceed concurrently (persists in the db file)
+        if self.use_wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Create client_inputs table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS client_inputs (
@@ -143,60 +138,96 @@ class InputHistoryDB:
             )
         ''')
         
-        # Create index for faster lookups
+        # Recent-first queries order by id (insertion order), so the old timestamp index only costs writes
+        cursor.execute('DROP INDEX IF EXISTS idx_timestamp')
+        
+        # Per-user lookups: the recent-inputs query reads it newest-first (no sort step)
+        cursor.execute('DROP INDEX IF EXISTS idx_user_timestamp')
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_timestamp 
-            ON client_inputs(timestamp DESC)
+            CREATE INDEX IF NOT EXISTS idx_user_id 
+            ON client_inputs(user_id, id DESC)
         ''')
+        conn.commit()
         
+        # Per-user input counts kept up to date by triggers, so counting is a single-row lookup
+        # instead of a scan over the user's inputs. Created and backfilled in one write transaction
+        # so concurrent workers starting up can't both backfill
+        cursor.execute("BEGIN IMMEDIATE")
+        has_stats = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'user_stats'"
+        ).fetchone()
+        if not has_stats:
+            cursor.execute('''
+                CREATE TABLE user_stats (
+                    user_id TEXT PRIMARY KEY,
+                    cnt INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute('''
+                INSERT INTO user_stats (user_id, cnt) 
+                SELECT user_id, COUNT(*) FROM client_inputs WHERE user_id IS NOT NULL GROUP BY user_id
+            ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_client_inputs_count_insert 
+            AFTER INSERT ON client_inputs WHEN NEW.user_id IS NOT NULL
+            BEGIN
+                INSERT INTO user_stats (user_id, cnt) VALUES (NEW.user_id, 1)
+                ON CONFLICT(user_id) DO UPDATE SET cnt = cnt + 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_client_inputs_count_delete 
+            AFTER DELETE ON client_inputs WHEN OLD.user_id IS NOT NULL
+            BEGIN
+                UPDATE user_stats SET cnt = cnt - 1 WHERE user_id = OLD.user_id;
+            END
+        ''')
         conn.commit()
         conn.close()
     
+    def _note_inserts(self, conn: sqlite3.Connection, count: int):
+        """Refresh the query planner's statistics every OPTIMIZE_EVERY inserts as the table grows"""
+        self._inserts_since_optimize += count
+        if self._inserts_since_optimize >= self.OPTIMIZE_EVERY:
+            self._inserts_since_optimize = 0
+            # Re-analyzes only the tables/indexes whose statistics are stale (cheap when nothing is)
+            conn.execute("PRAGMA optimize")
+    
     def store_input(self, input_text: str, session_id: str = None, user_id: str = "default") -> bool:
         """Store a client input in the database"""
+        conn = self._conn()
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO client_inputs (input_text, session_id, user_id) 
-                VALUES (?, ?, ?)
-            ''', (input_text, session_id, user_id))
+            conn.execute(_SQL_INSERT_INPUT, (input_text, session_id, user_id))
             
             conn.commit()
-            conn.close()
+            self._note_inserts(conn, 1)
             return True
             
         except Exception as e:
+            conn.rollback()
             print(f"Error storing input: {e}")
             return False
     
-    def get_recent_inputs(self, k: int = 5, user_id: str = "default") -> List[Dict[str, Any]]:
-        """Retrieve the last k client inputs from the database"""
+    def store_inputs(self, rows: List[tuple]) -> bool:
+        """Store a batch of (input_text, session_id, user_id) rows in a single transaction"""
+        conn = self._conn()
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, input_text, timestamp, session_id 
-                FROM client_inputs 
-                WHERE user_id = ? 
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            ''', (user_id, k))
+            conn.executemany(_SQL_INSERT_INPUT, rows)
             
-            results = cursor.fetchall()
-            conn.close()
+            conn.commit()
+            self._note_inserts(conn, len(rows))
+            return True
             
-            return [
-                {
-                    "id": row[0],
-                    "input": row[1],
-                    "timestamp": row[2],
-                    "session_id": row[3]
-                } 
-                for row in results
-            ]
+        except Exception as e:
+            conn.rollback()
+            print(f"Error storing inputs: {e}")
+            return False
+    
+    def get_recent_inputs(self, k: int = 5, user_id: str = "default") -> List[sqlite3.Row]:
+        """Retrieve the last k client inputs from the database (rows support record['input'] etc.,
+        and record['total'] is the user's total number of stored inputs)"""
+        try:
+            return self._conn().execute(_SQL_RECENT_INPUTS, (user_id, k)).fetchall()
             
         except Exception as e:
             print(f"Error retrieving recent inputs: {e}")
@@ -205,15 +236,7 @@ class InputHistoryDB:
     def get_input_count(self, user_id: str = "default") -> int:
         """Get total count of stored inputs for a user"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT COUNT(*) FROM client_inputs WHERE user_id = ?
-            ''', (user_id,))
-            
-            result = cursor.fetchone()
-            conn.close()
+            result = self._conn().execute(_SQL_COUNT_INPUTS, (user_id,)).fetchone()
             
             return result[0] if result else 0
             
@@ -233,6 +256,14 @@ def store_client_input(input_text: str, session_id: str = None, user_id: str = "
     else:
         return f"❌ Failed to store client input"
 
+def store_client_inputs(rows: List[tuple]) -> str:
+    """Store a batch of (input_text, session_id, user_id) client inputs in the history database"""
+    success = history_db.store_inputs(rows)
+    if success:
+        return f"✅ Stored {len(rows)} client input(s) in history database"
+    else:
+        return f"❌ Failed to store {len(rows)} client input(s)"
+
 def get_recent_client_inputs(k: int = 10, user_id: str = "default") -> str:
     """Retrieve the last k client inputs from the history database (optimized for context efficiency)"""
     try:
@@ -245,32 +276,32 @@ def get_recent_client_inputs(k: int = 10, user_id: str = "default") -> str:
         else:
             output_prefix = ""
             
+        # Each row also carries the user's total input count, saving a separate COUNT query
         inputs = history_db.get_recent_inputs(k, user_id)
-        total_count = history_db.get_input_count(user_id)
+        total_count = inputs[0]['total'] if inputs else 0
         
         if not inputs:
             return f"❌ No client inputs found in database (total stored: {total_count})"
         
         # Compact format to save tokens
-        output = f"{output_prefix}📋 Last {len(inputs)} inputs ({total_count} total):\n"
+        lines = [f"{output_prefix}📋 Last {len(inputs)} inputs ({total_count} total):"]
         
         for i, record in enumerate(inputs, 1):
             # More compact timestamp
-            timestamp = datetime.fromisoformat(record['timestamp'].replace('Z', '+00:00')) if record['timestamp'] else None
-            time_str = timestamp.strftime("%m/%d %H:%M") if timestamp else "?"
+            time_str = record['time'] or "?"
             
             # Show more characters for number pairs and important data
             input_text = record['input']
             if len(input_text) > 120:  # Increased from 60 to 120 to show full number pairs
                 input_text = input_text[:117] + "..."
             
-            output += f"{i}. [{time_str}] {input_text}\n"
+            lines.append(f"{i}. [{time_str}] {input_text}")
         
         # Add summary if there are many more inputs
         if total_count > len(inputs):
-            output += f"... and {total_count - len(inputs)} more inputs in history\n"
+            lines.append(f"... and {total_count - len(inputs)} more inputs in history")
         
-        return output.strip()
+        return "\n".join(lines).strip()
         
     except ValueError:
         return "❌ Invalid number format for k parameter"
@@ -413,6 +444,20 @@ AVAILABLE_TOOLS = [
             "required": []
         }
     },
+    {
+        "name": "final_answer",
+        "description": "Return the final answer to the user and end the conversation. Use this for the 14-digit tic-tac-toe winning number",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "value": {
+                    "type": "string",
+                    "description": "The bare answer, e.g. the 14-digit winning number with no other text"
+                }
+            },
+            "required": ["value"]
+        }
+    },
     {
         "name": "close_tictactoe_browser", 
         "description": "Close the tic-tac-toe browser when done playing (cleanup)",
@@ -420,132 +465,140 @@ AVAILABLE_TOOLS = [
             "type": "object",
             "properties": {},
             "required": []
-        }
+        },
+        # Prompt-caching breakpoint: the whole tools block is cached and reused on later iterations/requests
+        "cache_control": {"type": "ephemeral"}
     }
 ]
 
-# Tool execution function
-def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> str:
-    """Execute a tool by name with given arguments"""
+# Handled by the agent loop itself rather than execute_tool: its input is returned as the response
+FINAL_ANSWER_TOOL = "final_answer"
+
+# Tools that drive the shared tic-tac-toe browser session; these must run one at a time, in order
+SEQUENTIAL_TOOLS = frozenset({
+    "press_cell",
+    "getCurrGameStatus",
+    "getWinningNumber",
+    "start_new_tictactoe_game",
+    "close_tictactoe_browser",
+})
+
+# Tools whose results depend on external or time-sensitive state; responses that used them must not be cached.
+# execute_code is included because snippets can read the clock, random numbers or the environment
+STATEFUL_TOOLS = SEQUENTIAL_TOOLS | {"get_recent_client_inputs", "execute_code"}
+
+def execute_tools_in_order(calls: List[tuple]) -> List[str]:
+    """Execute (tool_name, arguments) pairs one after another while holding the browser lock"""
+    with ttt_driver_manager.lock:
+        return [execute_tool(tool_name, arguments) for tool_name, arguments in calls]
+
+def _press_cell_tool(arguments: Dict[str, Any]) -> str:
+    """Press a cell on the shared tic-tac-toe browser"""
+    driver = get_driver()
+    result = press_cell(arguments["num"], driver=driver)
+    return f"✅ Cell {arguments['num']} pressed successfully" if result else f"❌ Failed to press cell {arguments['num']}"
+
+def _game_status_tool(arguments: Dict[str, Any]) -> str:
+    """Read the board and render it with available moves, win opportunities and block threats"""
     try:
-        if tool_name == "md5_digest":
-            return md5_digest(arguments["data"])
-        elif tool_name == "sha512_digest":
-            return sha512_digest(arguments["data"])
-        elif tool_name == "base64_encode":
-            return base64_encode(arguments["data"])
-        elif tool_name == "base64_decode":
-            return base64_decode(arguments["data"])
-        elif tool_name == "execute_code":
-            return execute_code(arguments["code"])
-        elif tool_name == "get_recent_client_inputs":
-            return get_recent_client_inputs(
-                k=arguments["k"], 
-                user_id=arguments.get("user_id", "default")
-            )
-        elif tool_name == "press_cell":
-            driver = ttt_driver_manager.get_driver()
-            result = press_cell(arguments["num"], driver=driver)
-            return f"✅ Cell {arguments['num']} pressed successfully" if result else f"❌ Failed to press cell {arguments['num']}"
-        elif tool_name == "getCurrGameStatus":
-            try:
-                driver = ttt_driver_manager.get_driver()
-                result = getCurrGameStatus(driver=driver)
-                if result:
-                    board = result['currentGameBoard']
-                    status = result['gameStatus']
-                    
-                    # Create enhanced board visualization with positions and clear grid
-                    def format_cell(row, col, cell):
-                        pos = row * 3 + col
-                        if cell:
-                            return f" {cell.upper()} "
-                        else:
-                            return f" {pos} "
-                    
-                    board_display = "📋 GAME BOARD (You are X, Computer is O):\n"
-                    board_display += "   Positions: 0|1|2, 3|4|5, 6|7|8\n"
-                    board_display += "   ┌───┬───┬───┐\n"
-                    
-                    for row in range(3):
-                        board_display += "   │"
-                        for col in range(3):
-                            board_display += format_cell(row, col, board[row][col]) + "│"
-                        board_display += "\n"
-                        if row < 2:
-                            board_display += "   ├───┼───┼───┤\n"
-                    
-                    board_display += "   └───┴───┴───┘\n"
-                    board_display += f"🎯 Status: {status.upper()}"
-                    
-                    # Add strategic analysis
-                    if status == "still playing":
-                        empty_cells = []
-                        for row in range(3):
-                            for col in range(3):
-                                if board[row][col] == '':
-                                    empty_cells.append(row * 3 + col)
-                        board_display += f"\n🎲 Available moves: {empty_cells}"
-                        
-                        # Check for immediate threats/opportunities
-                        threats = []
-                        opportunities = []
-                        
-                        # Quick analysis for wins/blocks (simplified)
-                        lines = [
-                            [(0,0),(0,1),(0,2)], [(1,0),(1,1),(1,2)], [(2,0),(2,1),(2,2)],  # rows
-                            [(0,0),(1,0),(2,0)], [(0,1),(1,1),(2,1)], [(0,2),(1,2),(2,2)],  # cols  
-                            [(0,0),(1,1),(2,2)], [(0,2),(1,1),(2,0)]  # diagonals
-                        ]
-                        
-                        for line in lines:
-                            x_count = sum(1 for r,c in line if board[r][c] == 'x')
-                            o_count = sum(1 for r,c in line if board[r][c] == 'o')
-                            empty_count = sum(1 for r,c in line if board[r][c] == '')
-                            
-                            if x_count == 2 and empty_count == 1:  # Can win
-                                for r,c in line:
-                                    if board[r][c] == '':
-                                        opportunities.append(r*3+c)
-                            elif o_count == 2 and empty_count == 1:  # Must block
-                                for r,c in line:
-                                    if board[r][c] == '':
-                                        threats.append(r*3+c)
-                        
-                        if opportunities:
-                            board_display += f"\n🎯 WIN OPPORTUNITIES: {list(set(opportunities))}"
-                        if threats:
-                            board_display += f"\n🚨 BLOCK THREATS: {list(set(threats))}"
-                    
-                    return board_display
-                else:
-                    return "❌ Failed to get game status"
-            except Exception as e:
-                if "timeout" in str(e).lower() or "timeoutexception" in str(e):
-                    ttt_driver_manager.close_driver()  # Reset driver on timeout
-                    return "⏱️ Website loading timeout - try again or check connection"
+        driver = get_driver()
+        result = getCurrGameStatus(driver=driver)
+        if result:
+            board = as_2d(result['currentGameBoard'])
+            status = result['gameStatus']
+            
+            # Create enhanced board visualization with positions and clear grid
+            def format_cell(row, col, cell):
+                pos = row * 3 + col
+                if cell:
+                    return f" {cell.upper()} "
                 else:
-                    return f"❌ Error getting game status: {str(e)}"
-        elif tool_name == "getWinningNumber":
-            driver = ttt_driver_manager.get_driver()
-            result = getWinningNumber(driver=driver)
-            return f"🏆 Winning number: {result}" if result else "❌ No winning number found"
-        elif tool_name == "start_new_tictactoe_game":
-            # Force a completely fresh game by refreshing and clearing cache
-            driver = ttt_driver_manager.get_driver()
-            driver.delete_all_cookies()  # Clear cookies
-            driver.refresh()  # Refresh to clear DOM state
-            driver.get("https://ttt.puppy9.com/")  # Navigate to fresh game
-            return "🎮 Started fresh tic-tac-toe game (cleared cache)"
-        elif tool_name == "close_tictactoe_browser":
-            ttt_driver_manager.close_driver()
-            return "🔒 Closed tic-tac-toe browser"
+                    return f" {pos} "
+            
+            board_display = "📋 GAME BOARD (You are X, Computer is O):\n"
+            board_display += "   Positions: 0|1|2, 3|4|5, 6|7|8\n"
+            board_display += "   ┌───┬───┬───┐\n"
+            
+            for row in range(3):
+                board_display += "   │"
+                for col in range(3):
+                    board_display += format_cell(row, col, board[row][col]) + "│"
+                board_display += "\n"
+                if row < 2:
+                    board_display += "   ├───┼───┼───┤\n"
+            
+            board_display += "   └───┴───┴───┘\n"
+            board_display += f"🎯 Status: {status.upper()}"
+            
+            # Add strategic analysis
+            if status == "still playing":
+                cells = result['currentGameBoard']
+                empty_cells = [pos for pos, cell in enumerate(cells) if cell == '']
+                board_display += f"\n🎲 Available moves: {empty_cells}"
+                
+                # Check for immediate threats/opportunities
+                opportunities, threats = analyze_board(cells)
+                if opportunities:
+                    board_display += f"\n🎯 WIN OPPORTUNITIES: {opportunities}"
+                if threats:
+                    board_display += f"\n🚨 BLOCK THREATS: {threats}"
+            
+            return board_display
         else:
-            return f"Unknown tool: {tool_name}"
+            return "❌ Failed to get game status"
     except Exception as e:
-        return f"Error executing {tool_name}: {str(e)}"
+        if "timeout" in str(e).lower() or "timeoutexception" in str(e):
+            close_driver()  # Reset driver on timeout
+            return "⏱️ Website loading timeout - try again or check connection"
+        else:
+            return f"❌ Error getting game status: {str(e)}"
 
+def _winning_number_tool(arguments: Dict[str, Any]) -> str:
+    """Read the winning number after a won game"""
+    driver = get_driver()
+    result = getWinningNumber(driver=driver)
+    return f"🏆 Winning number: {result}" if result else "❌ No winning number found"
 
+def _start_new_game_tool(arguments: Dict[str, Any]) -> str:
+    """Reload the game page for a fresh game"""
+    # Force a completely fresh game: clear cookies and cache over CDP, then load the page once
+    driver = get_driver()
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.get(ttt_driver_manager.game_url)  # Navigate to fresh game
+    mark_board_stale(driver)  # Reloaded page: wait for the board again
+    return "🎮 Started fresh tic-tac-toe game (cleared cache)"
 
+def _close_browser_tool(arguments: Dict[str, Any]) -> str:
+    """Close the shared tic-tac-toe browser"""
+    close_driver()
+    return "🔒 Closed tic-tac-toe browser"
 
+# Tool name -> handler taking the tool's arguments, built once for O(1) dispatch
+_TOOL_HANDLERS = {
+    "md5_digest": lambda arguments: md5_digest(arguments["data"]),
+    "sha512_digest": lambda arguments: sha512_digest(arguments["data"]),
+    "base64_encode": lambda arguments: base64_encode(arguments["data"]),
+    "base64_decode": lambda arguments: base64_decode(arguments["data"]),
+    "execute_code": lambda arguments: execute_code(arguments["code"]),
+    "get_recent_client_inputs": lambda arguments: get_recent_client_inputs(
+        k=arguments["k"],
+        user_id=arguments.get("user_id", "default")
+    ),
+    "press_cell": _press_cell_tool,
+    "getCurrGameStatus": _game_status_tool,
+    "getWinningNumber": _winning_number_tool,
+    "start_new_tictactoe_game": _start_new_game_tool,
+    "close_tictactoe_browser": _close_browser_tool,
+}
 
+# Tool execution function
+def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """Execute a tool by name with given arguments"""
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        return f"Unknown tool: {tool_name}"
+    try:
+        return handler(arguments)
+    except Exception as e:
+        return f"Error executing {tool_name}: {str(e)}"
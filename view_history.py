@@ -6,7 +6,6 @@ Run with: python view_history.py
 
 import sqlite3
 import os
-from datetime import datetime
 
 def view_recent_inputs(db_path="./client_history.db", limit=5):
     """View the most recent client inputs from the database"""
@@ -26,9 +25,11 @@ def view_recent_inputs(db_path="./client_history.db", limit=5):
         
         # Get recent inputs
         cursor.execute('''
-            SELECT id, input_text, timestamp, session_id, user_id
+            SELECT id, input_text,
+                   COALESCE(strftime('%Y-%m-%d %H:%M:%S', timestamp), timestamp, 'Unknown'),
+                   session_id, user_id
             FROM client_inputs 
-            ORDER BY timestamp DESC 
+            ORDER BY id DESC 
             LIMIT ?
         ''', (limit,))
         
@@ -43,14 +44,8 @@ def view_recent_inputs(db_path="./client_history.db", limit=5):
             print("   No inputs found in database.")
             return
         
-        for i, (id, input_text, timestamp, session_id, user_id) in enumerate(results, 1):
-            # Format timestamp
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                time_str = timestamp or "Unknown"
-            
+        # Timestamps are formatted by SQLite (unparseable values are shown as stored)
+        for i, (id, input_text, time_str, session_id, user_id) in enumerate(results, 1):
             print(f"\n{i}. ID: {id}")
             print(f"   Time: {time_str}")
             print(f"   User: {user_id}")